@@ -1,25 +1,11 @@
 /**
  * Cloudflare Workers - 用户登出接口
  * 部署路径: /api/user/logout
+ * 实现见 shared/api（与 server.js 共用）
  */
 
-export async function onRequest(context) {
-  const request = context.request;
-
-  // 仅处理 POST 请求
-  if (request.method !== 'POST') {
-    return new Response('Method not allowed', { status: 405 });
-  }
+import { getApi } from '../../../shared/api/index.js';
 
-  return new Response(
-    JSON.stringify({
-      code: 0,
-      data: null,
-      message: '登出成功'
-    }),
-    {
-      status: 200,
-      headers: { 'Content-Type': 'application/json' }
-    }
-  );
+export async function onRequest(context) {
+  return getApi(context.env).logout(context.request, context);
 }
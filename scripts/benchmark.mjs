@@ -0,0 +1,154 @@
+/**
+ * 生产预览服务器基准测试
+ *
+ * 用法：
+ *   pnpm build
+ *   node scripts/benchmark.mjs                       自动以性能模式启动 server.js 并测试
+ *   node scripts/benchmark.mjs --single              以单进程模式启动，用于对比
+ *   node scripts/benchmark.mjs --url http://host:port 测试已启动的服务
+ *
+ * 参数：
+ *   --url          被测服务地址（不指定时自动启动 server.js）
+ *   --concurrency  并发连接数，默认 50
+ *   --duration     每个场景的持续时间（秒），默认 10
+ *   --workers      自动启动时的工作进程数，默认 CPU 核数
+ *
+ * 场景：静态资源（brotli）、静态资源 304、SPA 路由回退、Mock API；
+ * 使用 keep-alive 连接池发送请求，输出 req/s 与 p50/p95/p99 延迟
+ */
+
+import http from 'http';
+import path from 'path';
+import fs from 'fs';
+import { spawn } from 'child_process';
+import { fileURLToPath } from 'url';
+import { parseArgs, runLoad, printResults } from './load-test.mjs';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.resolve(__dirname, '..');
+
+const argv = process.argv.slice(2);
+const single = argv.includes('--single');
+const options = parseArgs(
+  argv.filter((arg) => arg !== '--single'),
+  { url: '', concurrency: 50, duration: 10, workers: 0 }
+);
+
+const agent = new http.Agent({ keepAlive: true, maxSockets: options.concurrency });
+
+/**
+ * 发送请求并读取完响应体
+ */
+function request(url, { method = 'GET', headers = {}, body } = {}) {
+  return new Promise((resolve, reject) => {
+    const req = http.request(url, { method, headers, agent }, (res) => {
+      const chunks = [];
+      res.on('data', (chunk) => chunks.push(chunk));
+      res.on('end', () => resolve({ status: res.statusCode, headers: res.headers, body: Buffer.concat(chunks) }));
+      res.on('error', reject);
+    });
+    req.on('error', reject);
+    req.end(body);
+  });
+}
+
+/**
+ * 启动 server.js 并等待就绪
+ */
+async function startServer() {
+  const port = 4500 + Math.floor(Math.random() * 500);
+  const args = [path.join(ROOT, 'server.js')];
+  if (!single) args.push('--perf');
+  const child = spawn(process.execPath, args, {
+    env: {
+      ...process.env,
+      PORT: String(port),
+      ...(options.workers ? { WEB_CONCURRENCY: String(options.workers) } : {})
+    },
+    stdio: 'ignore'
+  });
+
+  const url = `http://localhost:${port}`;
+  for (let i = 0; i < 100; i++) {
+    try {
+      await request(`${url}/api/user/logout`, { method: 'POST' });
+      // 多进程模式下等待所有工作进程启动
+      await new Promise((resolve) => setTimeout(resolve, single ? 0 : 1000));
+      return { url, stop: () => child.kill('SIGTERM') };
+    } catch {
+      await new Promise((resolve) => setTimeout(resolve, 100));
+    }
+  }
+  child.kill('SIGKILL');
+  throw new Error('server.js 启动超时');
+}
+
+async function main() {
+  if (!options.url && !fs.existsSync(path.join(ROOT, 'dist', 'index.html'))) {
+    console.error('❌ 未找到 dist/index.html，请先执行 pnpm build');
+    process.exit(1);
+  }
+
+  const server = options.url ? null : await startServer();
+  const url = options.url || server.url;
+
+  try {
+    // 从 index.html 中取入口脚本作为静态资源样本
+    const index = await request(`${url}/`);
+    const entry = /<script[^>]+src="([^"]+)"/.exec(index.body.toString())?.[1];
+    if (!entry) throw new Error('无法从 index.html 中找到入口脚本');
+
+    const compressed = { 'Accept-Encoding': 'br, gzip' };
+    const asset = await request(`${url}${entry}`, { headers: compressed });
+
+    const login = await request(`${url}/api/user/login`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ username: 'admin', password: 'admin123' })
+    });
+    const { token } = JSON.parse(login.body.toString()).data;
+    const auth = { Authorization: `Bearer ${token}` };
+
+    const scenarios = [
+      {
+        name: `静态资源 ${asset.headers['content-encoding'] || 'identity'}`,
+        request: () => request(`${url}${entry}`, { headers: compressed })
+      },
+      {
+        name: '静态资源 304',
+        request: () => request(`${url}${entry}`, { headers: { ...compressed, 'If-None-Match': asset.headers.etag } })
+      },
+      {
+        name: 'SPA 路由回退',
+        request: () => request(`${url}/users`, { headers: { ...compressed, Accept: 'text/html' } })
+      },
+      {
+        name: 'Mock API 列表',
+        request: () => request(`${url}/api/user/list?page=1&pageSize=10`, { headers: auth })
+      },
+      {
+        name: 'Mock API 用户信息',
+        request: () => request(`${url}/api/user/info`, { headers: auth })
+      }
+    ];
+
+    const mode = options.url ? url : single ? '单进程' : `性能模式（${options.workers || '全部核心'}）`;
+    console.log(`🎯 ${mode}  并发 ${options.concurrency}  每个场景 ${options.duration}s\n`);
+
+    const results = [];
+    for (const scenario of scenarios) {
+      results.push(
+        await runLoad({ ...scenario, concurrency: options.concurrency, duration: options.duration })
+      );
+    }
+    printResults(results);
+  } finally {
+    agent.destroy();
+    server?.stop();
+  }
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
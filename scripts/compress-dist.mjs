@@ -0,0 +1,91 @@
+/**
+ * 构建产物预压缩
+ *
+ * 用法：
+ *   node scripts/compress-dist.mjs    （pnpm build 后自动执行）
+ *
+ * 说明：
+ * - 为 dist 中的文本资源生成 .br（brotli 最高压缩级别）与 .gz（gzip -9）文件，
+ *   由 server.js 按 Accept-Encoding 直接返回，运行时不再压缩
+ * - 压缩后没有变小的文件不生成对应版本
+ * - index.html 最后处理，server.js 据此判断构建产物已完整写入
+ */
+
+import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
+import { promisify } from 'util';
+import { fileURLToPath } from 'url';
+
+const brotli = promisify(zlib.brotliCompress);
+const gzip = promisify(zlib.gzip);
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const DIST_DIR = path.resolve(__dirname, '..', 'dist');
+
+const COMPRESSIBLE = /\.(js|mjs|css|html|json|map|svg|txt|xml|wasm)$/i;
+// 太小的文件压缩收益不足以抵消额外请求头
+const MIN_SIZE = 1024;
+
+function walk(dir, files = []) {
+  for (const dirent of fs.readdirSync(dir, { withFileTypes: true })) {
+    const file = path.join(dir, dirent.name);
+    if (dirent.isDirectory()) walk(file, files);
+    else if (COMPRESSIBLE.test(dirent.name)) files.push(file);
+  }
+  return files;
+}
+
+async function compress(file) {
+  const source = await fs.promises.readFile(file);
+  if (source.length < MIN_SIZE) return { source: source.length, br: 0, gz: 0 };
+
+  const [br, gz] = await Promise.all([
+    brotli(source, {
+      params: {
+        [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+        [zlib.constants.BROTLI_PARAM_SIZE_HINT]: source.length
+      }
+    }),
+    gzip(source, { level: 9 })
+  ]);
+
+  const writes = [];
+  if (gz.length < source.length) writes.push(fs.promises.writeFile(`${file}.gz`, gz));
+  if (br.length < source.length) writes.push(fs.promises.writeFile(`${file}.br`, br));
+  await Promise.all(writes);
+  return { source: source.length, br: br.length, gz: gz.length };
+}
+
+async function main() {
+  if (!fs.existsSync(DIST_DIR)) {
+    console.error('❌ 未找到 dist 目录，请先执行构建');
+    process.exit(1);
+  }
+
+  const indexFile = path.join(DIST_DIR, 'index.html');
+  const files = walk(DIST_DIR).filter((file) => file !== indexFile);
+
+  const totals = { source: 0, br: 0, gz: 0 };
+  const add = (result) => {
+    totals.source += result.source;
+    totals.br += result.br || result.source;
+    totals.gz += result.gz || result.source;
+  };
+
+  // 分批并行，避免同时打开过多文件
+  for (let i = 0; i < files.length; i += 8) {
+    (await Promise.all(files.slice(i, i + 8).map(compress))).forEach(add);
+  }
+  if (fs.existsSync(indexFile)) add(await compress(indexFile));
+
+  const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+  console.log(
+    `✅ 已压缩 ${files.length + 1} 个文件：${kb(totals.source)} → br ${kb(totals.br)} / gzip ${kb(totals.gz)}`
+  );
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
@@ -0,0 +1,191 @@
+/**
+ * API 压测脚本
+ *
+ * 用法：
+ *   pnpm preview:mock                                 启动 server.js（默认 http://localhost:4176）
+ *   node scripts/load-test.mjs
+ *
+ *   npx wrangler pages dev dist                       或启动 Cloudflare Functions 本地环境
+ *   node scripts/load-test.mjs --url http://localhost:8788
+ *
+ * 参数：
+ *   --url          服务地址，默认 http://localhost:4176
+ *   --concurrency  并发数，默认 20
+ *   --duration     每个场景的持续时间（秒），默认 10
+ *
+ * 场景：页码分页、搜索、游标翻页、带 If-None-Match 的列表与用户信息请求；
+ * 输出每个场景的吞吐量、延迟分位数、状态码分布与边缘缓存命中数
+ */
+
+import { pathToFileURL } from 'url';
+
+/**
+ * 解析命令行参数
+ * @param {string[]} argv
+ * @param {Record<string, string | number>} defaults
+ */
+export function parseArgs(argv, defaults) {
+  const options = { ...defaults };
+  for (let i = 0; i < argv.length; i++) {
+    const match = /^--([\w-]+)$/.exec(argv[i]);
+    if (!match) continue;
+    const value = argv[++i];
+    options[match[1]] = typeof defaults[match[1]] === 'number' ? Number(value) : value;
+  }
+  return options;
+}
+
+function percentile(sorted, p) {
+  if (sorted.length === 0) return 0;
+  return sorted[Math.min(sorted.length - 1, Math.floor((p / 100) * sorted.length))];
+}
+
+/**
+ * 以固定并发持续执行请求
+ * @param {Object} options
+ * @param {string} options.name 场景名
+ * @param {number} options.concurrency 并发数
+ * @param {number} options.duration 持续时间（秒）
+ * @param {(worker: number) => Promise<{ status: number, headers: any }>} options.request
+ *        发起一次请求（需读取完响应体）；headers 可以是 Headers 或 Node 的响应头对象
+ */
+export async function runLoad({ name, concurrency, duration, request }) {
+  const latencies = [];
+  const statuses = {};
+  let errors = 0;
+  let hits = 0;
+  const start = performance.now();
+  const deadline = start + duration * 1000;
+
+  const worker = async (id) => {
+    while (performance.now() < deadline) {
+      const begin = performance.now();
+      try {
+        const response = await request(id);
+        latencies.push(performance.now() - begin);
+        statuses[response.status] = (statuses[response.status] || 0) + 1;
+        const { headers } = response;
+        const cache = typeof headers.get === 'function' ? headers.get('x-cache') : headers['x-cache'];
+        if (cache === 'HIT') hits++;
+      } catch {
+        errors++;
+      }
+    }
+  };
+
+  await Promise.all(Array.from({ length: concurrency }, (_, id) => worker(id)));
+
+  const elapsed = (performance.now() - start) / 1000;
+  latencies.sort((a, b) => a - b);
+  return {
+    name,
+    requests: latencies.length,
+    errors,
+    rps: latencies.length / elapsed,
+    p50: percentile(latencies, 50),
+    p95: percentile(latencies, 95),
+    p99: percentile(latencies, 99),
+    statuses,
+    hits
+  };
+}
+
+/**
+ * 打印结果表格
+ * @param {Awaited<ReturnType<typeof runLoad>>[]} results
+ */
+export function printResults(results) {
+  console.table(
+    results.map((r) => ({
+      场景: r.name,
+      请求数: r.requests,
+      错误: r.errors,
+      'req/s': Math.round(r.rps),
+      'p50 (ms)': r.p50.toFixed(1),
+      'p95 (ms)': r.p95.toFixed(1),
+      'p99 (ms)': r.p99.toFixed(1),
+      状态码: Object.entries(r.statuses)
+        .map(([status, count]) => `${status}×${count}`)
+        .join(' '),
+      缓存命中: r.hits
+    }))
+  );
+}
+
+const random = (max) => 1 + Math.floor(Math.random() * max);
+
+async function main() {
+  const { url, concurrency, duration } = parseArgs(process.argv.slice(2), {
+    url: 'http://localhost:4176',
+    concurrency: 20,
+    duration: 10
+  });
+
+  // 读取完响应体，保证连接可复用、计时包含传输时间
+  const get = async (path, headers) => {
+    const response = await fetch(`${url}${path}`, { headers });
+    await response.arrayBuffer();
+    return response;
+  };
+
+  const login = await fetch(`${url}/api/user/login`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ username: 'admin', password: 'admin123' })
+  });
+  if (!login.ok) {
+    console.error(`❌ 无法登录 ${url}（HTTP ${login.status}），请确认服务已启动`);
+    process.exit(1);
+  }
+  const { data } = await login.json();
+  const auth = { Authorization: `Bearer ${data.token}` };
+
+  const listEtag = (await get('/api/user/list?page=1&pageSize=10', auth)).headers.get('etag');
+  const infoEtag = (await get('/api/user/info', auth)).headers.get('etag');
+
+  // 每个并发各自沿游标向后翻页，到底后从头开始
+  const cursors = [];
+
+  const scenarios = [
+    {
+      name: '列表 页码分页',
+      request: () => get(`/api/user/list?page=${random(10)}&pageSize=10`, auth)
+    },
+    {
+      name: '列表 搜索',
+      request: () => get(`/api/user/list?search=user${random(99)}&pageSize=10`, auth)
+    },
+    {
+      name: '列表 游标翻页',
+      request: async (worker) => {
+        const cursor = cursors[worker] ? `&cursor=${cursors[worker]}` : '';
+        const response = await fetch(`${url}/api/user/list?pageSize=10${cursor}`, { headers: auth });
+        const body = response.ok ? await response.json() : null;
+        cursors[worker] = body?.data?.nextCursor || null;
+        return response;
+      }
+    },
+    {
+      name: '列表 If-None-Match',
+      request: () => get('/api/user/list?page=1&pageSize=10', { ...auth, 'If-None-Match': listEtag })
+    },
+    {
+      name: '用户信息 If-None-Match',
+      request: () => get('/api/user/info', { ...auth, 'If-None-Match': infoEtag })
+    }
+  ];
+
+  console.log(`🎯 ${url}  并发 ${concurrency}  每个场景 ${duration}s\n`);
+  const results = [];
+  for (const scenario of scenarios) {
+    results.push(await runLoad({ ...scenario, concurrency, duration }));
+  }
+  printResults(results);
+}
+
+if (import.meta.url === pathToFileURL(process.argv[1]).href) {
+  main().catch((error) => {
+    console.error(error);
+    process.exit(1);
+  });
+}
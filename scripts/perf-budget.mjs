@@ -0,0 +1,180 @@
+/**
+ * 性能预算检查
+ *
+ * 用法：
+ *   pnpm perf:setup          安装测量冷启动所需的 playwright 与 Chromium（首次使用前执行一次，
+ *                            安装到 .perf-tools 目录，不写入项目依赖）
+ *   pnpm perf:check          构建后检查
+ *   pnpm perf:calibrate      构建后按实测值（留 10% 余量）写入预算
+ *   node scripts/perf-budget.mjs   仅检查已有的 dist 目录
+ *
+ * 说明：
+ * - 解析 dist/index.html，统计首屏加载的 JS（入口 + modulepreload）与 CSS 的 gzip 体积
+ * - 统计最大的 JS 分包体积
+ * - 启动 server.js，用 playwright 测量登录页冷启动可交互时间（playwright 不可用时检查失败）
+ * - 预算配置见 perf-budget.json，任一项超出预算时以非零状态码退出；
+ *   缺少预算项时提示先执行 pnpm perf:calibrate
+ */
+
+import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
+import { spawn } from 'child_process';
+import { createRequire } from 'module';
+import { fileURLToPath, pathToFileURL } from 'url';
+
+const __dirname = path.dirname(fileURLToPath(import.meta.url));
+const ROOT = path.resolve(__dirname, '..');
+const DIST_DIR = path.join(ROOT, 'dist');
+const BUDGET_FILE = path.join(ROOT, 'perf-budget.json');
+const budget = JSON.parse(fs.readFileSync(BUDGET_FILE, 'utf-8'));
+const CALIBRATE = process.argv.includes('--calibrate');
+const BUDGET_KEYS = ['bootJsGzip', 'bootCssGzip', 'largestChunkGzip', 'loginInteractiveMs'];
+// perf:setup 安装 playwright 的目录
+const TOOLS_DIR = path.join(ROOT, '.perf-tools');
+// 校准时在实测值基础上保留的余量
+const CALIBRATE_HEADROOM = 1.1;
+
+const gzipSize = (file) => zlib.gzipSync(fs.readFileSync(file), { level: 9 }).length;
+const formatKB = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+
+/**
+ * 从 index.html 中收集首屏资源
+ */
+function collectBootAssets(html) {
+  const js = new Set();
+  const css = new Set();
+  for (const [, src] of html.matchAll(/<script[^>]+type="module"[^>]+src="([^"]+)"/g)) js.add(src);
+  for (const [, href] of html.matchAll(/<link[^>]+rel="modulepreload"[^>]+href="([^"]+)"/g)) js.add(href);
+  for (const [, href] of html.matchAll(/<link[^>]+rel="stylesheet"[^>]+href="([^"]+)"/g)) css.add(href);
+  const toFile = (url) => path.join(DIST_DIR, url.replace(/^\//, ''));
+  return { js: [...js].map(toFile), css: [...css].map(toFile) };
+}
+
+/**
+ * 测量登录页冷启动可交互时间（需要 playwright）
+ */
+async function measureLoginInteractive() {
+  let playwright;
+  try {
+    // 优先使用项目依赖中的 playwright，其次使用 perf:setup 安装的版本
+    playwright = await import('playwright').catch(() => {
+      const entry = createRequire(path.join(TOOLS_DIR, 'index.js')).resolve('playwright');
+      return import(pathToFileURL(entry).href);
+    });
+  } catch {
+    throw new Error('未安装 playwright，无法测量冷启动时间，请先执行 pnpm perf:setup');
+  }
+
+  const port = 4300 + Math.floor(Math.random() * 500);
+  const server = spawn(process.execPath, [path.join(ROOT, 'server.js')], {
+    env: { ...process.env, PORT: String(port) },
+    stdio: 'ignore'
+  });
+
+  try {
+    const url = `http://localhost:${port}/login`;
+    // 等待服务器就绪
+    for (let i = 0; i < 50; i++) {
+      try {
+        await fetch(url);
+        break;
+      } catch {
+        await new Promise((resolve) => setTimeout(resolve, 100));
+      }
+    }
+
+    const browser = await playwright.chromium.launch();
+    try {
+      const page = await browser.newPage();
+      const start = Date.now();
+      await page.goto(url);
+      // 登录表单可输入即视为可交互
+      await page.waitForSelector('input', { state: 'visible' });
+      return Date.now() - start;
+    } finally {
+      await browser.close();
+    }
+  } finally {
+    server.kill();
+  }
+}
+
+async function main() {
+  if (!CALIBRATE) {
+    const missing = BUDGET_KEYS.filter((key) => typeof budget[key] !== 'number');
+    if (missing.length > 0) {
+      console.error(`❌ 性能预算未校准：perf-budget.json 缺少 ${missing.join(', ')}`);
+      console.error('   请执行 pnpm perf:calibrate，根据实际构建生成预算');
+      process.exit(1);
+    }
+    if (!budget.calibratedAt) {
+      console.warn('⚠️  当前预算为初始估计值，尚未按实际构建校准（pnpm perf:calibrate）\n');
+    }
+  }
+
+  const indexFile = path.join(DIST_DIR, 'index.html');
+  if (!fs.existsSync(indexFile)) {
+    console.error('❌ 未找到 dist/index.html，请先执行构建');
+    process.exit(1);
+  }
+
+  const boot = collectBootAssets(fs.readFileSync(indexFile, 'utf-8'));
+  const bootJs = boot.js.reduce((sum, file) => sum + gzipSize(file), 0);
+  const bootCss = boot.css.reduce((sum, file) => sum + gzipSize(file), 0);
+
+  const assetsDir = path.join(DIST_DIR, 'assets');
+  let largest = { file: '', size: 0 };
+  for (const name of fs.readdirSync(assetsDir)) {
+    if (!name.endsWith('.js')) continue;
+    const size = gzipSize(path.join(assetsDir, name));
+    if (size > largest.size) largest = { file: name, size };
+  }
+
+  const results = [
+    { key: 'bootJsGzip', name: '首屏 JS (gzip)', value: bootJs, format: formatKB },
+    { key: 'bootCssGzip', name: '首屏 CSS (gzip)', value: bootCss, format: formatKB },
+    {
+      key: 'largestChunkGzip',
+      name: `最大分包 ${largest.file} (gzip)`,
+      value: largest.size,
+      format: formatKB
+    },
+    {
+      key: 'loginInteractiveMs',
+      name: '登录页冷启动可交互',
+      value: await measureLoginInteractive(),
+      format: (ms) => `${ms} ms`
+    }
+  ];
+
+  if (CALIBRATE) {
+    for (const { key, name, value, format } of results) {
+      budget[key] = Math.ceil(value * CALIBRATE_HEADROOM);
+      console.log(`📏 ${name}: ${format(value)} → 预算 ${format(budget[key])}`);
+    }
+    budget.calibratedAt = new Date().toISOString();
+    fs.writeFileSync(BUDGET_FILE, JSON.stringify(budget, null, 2) + '\n');
+    console.log('\n✅ 已写入 perf-budget.json');
+    return;
+  }
+
+  let failed = false;
+  for (const { key, name, value, format } of results) {
+    const limit = budget[key];
+    const ok = value <= limit;
+    failed ||= !ok;
+    console.log(`${ok ? '✅' : '❌'} ${name}: ${format(value)} / 预算 ${format(limit)}`);
+  }
+
+  if (failed) {
+    console.error('\n❌ 超出性能预算');
+    process.exit(1);
+  }
+  console.log('\n✅ 性能预算检查通过');
+}
+
+main().catch((error) => {
+  console.error(error);
+  process.exit(1);
+});
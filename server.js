@@ -3,229 +3,104 @@
  *
  * 用法：
  *   pnpm build
- *   pnpm preview:mock
+ *   pnpm preview:mock          单进程
+ *   pnpm preview:perf          性能模式（多进程）
  *
  * 访问：http://localhost:4176
  *
  * 说明：
- * - 提供静态文件服务（dist 目录）
+ * - 提供静态文件服务（dist 目录），优先返回预压缩文件，带哈希的资源长期缓存
  * - 集成 Mock API（同开发环境）
- * - 支持 SPA 路由
+ * - 支持 SPA 路由，index.html 常驻内存并在重新构建后自动更新
+ *
+ * 性能模式（--perf 或 PERF_MODE=1）：
+ * - 按 CPU 核数启动多个工作进程（WEB_CONCURRENCY 可指定数量）
+ * - 关闭逐请求日志
+ * - kill -HUP <主进程> 滚动重启工作进程
  */
 
 import express from 'express';
+import cluster from 'cluster';
 import path from 'path';
-import fs from 'fs';
 import { fileURLToPath } from 'url';
+import {
+  createApi,
+  MemoryStorage,
+  SqlStorage,
+  createSqliteD1,
+  generateMockUsers,
+  MOCK_USER_COUNT
+} from './shared/api/index.js';
+import { createStaticServer } from './server/static.js';
+import { runPrimary, SHUTDOWN_TIMEOUT } from './server/cluster.js';
 
 // 获取 __dirname（ES Module 中需要手动定义）
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = path.dirname(__filename);
 
-const app = express();
 const PORT = process.env.PORT || 4176;
 const DIST_DIR = path.resolve(__dirname, 'dist');
+const PERF_MODE = process.argv.includes('--perf') || process.env.PERF_MODE === '1';
 
-// ============ 中间件 ============
-app.use(express.json());
-app.use(express.urlencoded({ extended: true }));
-
-// 日志中间件
-app.use((req, res, next) => {
-  if (!req.path.startsWith('/api')) {
-    console.log(`${new Date().toLocaleTimeString()} ${req.method} ${req.path}`);
-  }
-  next();
-});
-
-// ============ Mock API 数据 ============
-const users = {
-  admin: {
-    id: '1',
-    username: 'admin',
-    realName: '管理员',
-    email: 'admin@example.com',
-    avatar: 'https://avatars.githubusercontent.com/u/120364369?s=200&v=4',
-    roles: ['admin'],
-    permissions: [
-      'system:user:list',
-      'system:user:add',
-      'system:user:edit',
-      'system:user:delete',
-      'system:role:list',
-      'system:role:add',
-      'system:role:edit',
-      'system:role:delete',
-      'system:permission:list',
-      'system:permission:add',
-      'system:permission:edit',
-      'system:permission:delete'
-    ]
-  },
-  user: {
-    id: '2',
-    username: 'user',
-    realName: '普通用户',
-    email: 'user@example.com',
-    avatar: 'https://avatars.githubusercontent.com/u/120364369?s=200&v=4',
-    roles: ['user'],
-    permissions: [
-      'system:user:list',
-      'system:user:edit'
-    ]
-  }
-};
-
-const tokenMap = {
-  'admin_token_12345': 'admin',
-  'user_token_67890': 'user'
-};
-
-// ============ Mock API 路由 ============
+// ============ Mock API ============
+// 与 Cloudflare Functions 共用 shared/api 中的数据与处理逻辑
 
 /**
- * 登录接口
+ * 创建 API 存储
+ * API_STORAGE=sqlite 时使用本地 SQLite（需要 Node 22.5+ 的 node:sqlite），
+ * 数据库文件由 API_SQLITE_FILE 指定（默认内存数据库）；否则使用内存存储
  */
-app.post('/api/user/login', (req, res) => {
-  const { username, password } = req.body;
-
-  if (username === 'admin' && password === 'admin123') {
-    return res.json({
-      code: 0,
-      data: {
-        token: 'admin_token_12345',
-        user: users.admin
-      },
-      message: '登录成功'
-    });
-  } else if (username === 'user' && password === 'user123') {
-    return res.json({
-      code: 0,
-      data: {
-        token: 'user_token_67890',
-        user: users.user
-      },
-      message: '登录成功'
-    });
-  } else {
-    return res.status(401).json({
-      code: 401,
-      data: null,
-      message: '用户名或密码错误'
-    });
+async function createStorage() {
+  const users = generateMockUsers(MOCK_USER_COUNT);
+  if (process.env.API_STORAGE === 'sqlite') {
+    try {
+      const { DatabaseSync } = await import('node:sqlite');
+      const database = new DatabaseSync(process.env.API_SQLITE_FILE || ':memory:');
+      return new SqlStorage(createSqliteD1(database), users);
+    } catch (error) {
+      console.warn('⚠️  当前 Node 版本不支持 node:sqlite，改用内存存储');
+    }
   }
-});
+  return new MemoryStorage(users);
+}
 
 /**
- * 获取当前用户信息接口
+ * 将 Express 请求转换为 Web 标准 Request
  */
-app.get('/api/user/info', (req, res) => {
-  const authHeader = req.get('authorization') || '';
-  const token = authHeader.replace('Bearer ', '');
-
-  const username = tokenMap[token];
-  if (username && users[username]) {
-    return res.json({
-      code: 0,
-      data: users[username],
-      message: '获取成功'
-    });
-  } else {
-    return res.status(401).json({
-      code: 401,
-      data: null,
-      message: 'Token无效或已过期'
-    });
+function toWebRequest(req) {
+  const headers = new Headers();
+  for (const [name, value] of Object.entries(req.headers)) {
+    if (value !== undefined) headers.set(name, Array.isArray(value) ? value.join(', ') : value);
   }
-});
-
-/**
- * 登出接口
- */
-app.post('/api/user/logout', (req, res) => {
-  res.json({
-    code: 0,
-    data: null,
-    message: '登出成功'
+  const hasBody = req.method !== 'GET' && req.method !== 'HEAD';
+  return new Request(`http://${req.headers.host || 'localhost'}${req.originalUrl}`, {
+    method: req.method,
+    headers,
+    // express.json() 已经读取了请求体，这里重新序列化
+    body: hasBody ? JSON.stringify(req.body ?? {}) : undefined
   });
-});
+}
 
 /**
- * 获取用户列表接口
+ * 将 Web 标准 Response 写回 Express 响应
  */
-app.get('/api/user/list', (req, res) => {
-  const page = parseInt(req.query.page) || 1;
-  const pageSize = parseInt(req.query.pageSize) || 10;
-  const searchText = (req.query.search || '').toLowerCase();
-
-  // 生成模拟数据
-  const mockUsers = Array.from({ length: 100 }, (_, i) => ({
-    id: `${i + 1}`,
-    username: `user${i + 1}`,
-    realName: `用户${i + 1}`,
-    email: `user${i + 1}@example.com`,
-    status: i % 2 === 0 ? 'active' : 'inactive',
-    createTime: new Date(Date.now() - Math.random() * 30 * 24 * 60 * 60 * 1000)
-      .toISOString()
-      .split('T')[0]
-  }));
-
-  let filtered = mockUsers;
-  if (searchText) {
-    filtered = filtered.filter(u =>
-      u.username.toLowerCase().includes(searchText) ||
-      u.realName.toLowerCase().includes(searchText) ||
-      u.email.toLowerCase().includes(searchText)
-    );
-  }
-
-  const total = filtered.length;
-  const start = (page - 1) * pageSize;
-  const end = start + pageSize;
-  const list = filtered.slice(start, end);
-
-  res.json({
-    code: 0,
-    data: {
-      list,
-      page,
-      pageSize,
-      total,
-      pageCount: Math.ceil(total / pageSize)
-    },
-    message: '获取成功'
-  });
-});
-
-// ============ 静态文件和 SPA 路由 ============
-
-// 提供静态文件
-app.use(express.static(DIST_DIR, {
-  maxAge: '1h',
-  etag: false
-}));
-
-// SPA 路由处理 - 所有未匹配的路由返回 index.html
-app.get('*', (req, res) => {
-  const indexPath = path.join(DIST_DIR, 'index.html');
-
-  if (!fs.existsSync(indexPath)) {
-    return res.status(404).send(
-      '❌ dist/index.html 不存在，请先执行 pnpm build'
-    );
-  }
-
-  res.sendFile(indexPath);
-});
-
-// ============ 启动服务器 ============
-app.listen(PORT, () => {
+async function sendWebResponse(res, response) {
+  res.status(response.status);
+  response.headers.forEach((value, name) => res.setHeader(name, value));
+  res.end(Buffer.from(await response.arrayBuffer()));
+}
+
+// ============ 启动信息 ============
+function printBanner() {
   console.log('\n' + '='.repeat(70));
   console.log('🚀 生产预览服务器已启动（支持 Mock API）');
   console.log('='.repeat(70));
   console.log(`\n📍 访问地址:     http://localhost:${PORT}`);
   console.log(`📁 静态资源:     ${DIST_DIR}`);
   console.log(`🔌 Mock API 前缀: /api`);
+  if (PERF_MODE) {
+    console.log(`⚡ 性能模式:     ${process.env.WEB_CONCURRENCY || '按 CPU 核数'} 个工作进程（主进程 PID ${process.pid}）`);
+  }
   console.log('\n🔑 测试凭证:');
   console.log('   管理员 - 用户名: admin   密码: admin123');
   console.log('   普通用户 - 用户名: user   密码: user123');
@@ -234,7 +109,85 @@ app.listen(PORT, () => {
   console.log('   - 可以测试打包后应用的完整功能');
   console.log('   - 生产环境需要配置真实的后端 API');
   console.log('\n' + '='.repeat(70) + '\n');
-});
+}
+
+// ============ 服务器 ============
+async function startServer() {
+  const app = express();
+  app.disable('x-powered-by');
+
+  // ============ 中间件 ============
+  app.use(express.json());
+  app.use(express.urlencoded({ extended: true }));
+
+  // 日志中间件（性能模式下关闭）
+  if (!PERF_MODE) {
+    app.use((req, res, next) => {
+      if (!req.path.startsWith('/api')) {
+        console.log(`${new Date().toLocaleTimeString()} ${req.method} ${req.path}`);
+      }
+      next();
+    });
+  }
+
+  // ============ Mock API 路由 ============
+  const api = createApi({ storage: await createStorage() });
+  const apiRoutes = {
+    '/api/user/login': api.login,
+    '/api/user/info': api.info,
+    '/api/user/logout': api.logout,
+    '/api/user/list': api.listUsers
+  };
+
+  for (const [route, handler] of Object.entries(apiRoutes)) {
+    app.all(route, (req, res, next) => {
+      handler(toWebRequest(req)).then((response) => sendWebResponse(res, response), next);
+    });
+  }
+
+  // ============ 静态文件和 SPA 路由 ============
+  const staticServer = createStaticServer(DIST_DIR, {
+    onReload: (files) => {
+      if (!cluster.isWorker || cluster.worker.id === 1) {
+        console.log(`📦 已加载构建产物：${files} 个文件`);
+      }
+    }
+  });
+
+  // 提供静态文件
+  app.use(staticServer.middleware);
+
+  // SPA 路由处理 - 所有未匹配的页面路由返回 index.html
+  app.use(staticServer.spaFallback);
+
+  // ============ 启动服务器 ============
+  const server = app.listen(PORT, () => {
+    if (!cluster.isWorker) printBanner();
+  });
+
+  // 单进程运行时自行优雅退出；多进程时由主进程统一调度
+  if (cluster.isWorker) {
+    process.on('SIGINT', () => {});
+    process.on('SIGTERM', () => {});
+  } else {
+    const shutdown = () => {
+      staticServer.close();
+      server.close(() => process.exit(0));
+      setTimeout(() => process.exit(0), SHUTDOWN_TIMEOUT).unref();
+    };
+    process.on('SIGINT', shutdown);
+    process.on('SIGTERM', shutdown);
+  }
+}
+
+if (PERF_MODE && cluster.isPrimary) {
+  runPrimary({
+    workers: Number(process.env.WEB_CONCURRENCY) || undefined,
+    onReady: printBanner
+  });
+} else {
+  await startServer();
+}
 
 // 错误处理
 process.on('uncaughtException', (error) => {
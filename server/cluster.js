@@ -0,0 +1,134 @@
+/**
+ * 多进程运行（cluster）
+ *
+ * - 按 CPU 核数启动工作进程，工作进程意外退出时自动重启（频繁崩溃时逐步延迟）
+ * - SIGHUP / SIGUSR2：滚动重启，新进程开始监听后再让旧进程处理完当前请求退出
+ * - SIGINT / SIGTERM：所有工作进程停止接收新连接，处理完当前请求后退出
+ */
+
+import cluster from 'cluster';
+import os from 'os';
+import { once } from 'events';
+
+// 工作进程优雅退出的最长等待时间
+export const SHUTDOWN_TIMEOUT = 10000;
+// 启动后多久内退出视为启动失败
+const CRASH_WINDOW = 5000;
+// 滚动重启时等待新进程开始监听的最长时间
+const STARTUP_TIMEOUT = 30000;
+const MAX_RESTART_DELAY = 30000;
+
+/**
+ * 启动主进程
+ * @param {Object} [options]
+ * @param {number} [options.workers] 工作进程数，默认 CPU 核数
+ * @param {() => void} [options.onReady] 首个工作进程开始监听时调用
+ */
+export function runPrimary({ workers = os.availableParallelism(), onReady } = {}) {
+  const startedAt = new Map();
+  let restartDelay = 0;
+  let shuttingDown = false;
+  let restarting = false;
+  // 滚动重启中尚未开始监听的新进程：退出时由滚动重启处理，不自动重启
+  const pendingReplacements = new Set();
+
+  const fork = () => {
+    const worker = cluster.fork();
+    startedAt.set(worker, Date.now());
+    return worker;
+  };
+
+  const stop = (worker) =>
+    new Promise((resolve) => {
+      if (worker.isDead()) return resolve();
+      const timer = setTimeout(() => worker.kill('SIGKILL'), SHUTDOWN_TIMEOUT);
+      worker.once('exit', () => {
+        clearTimeout(timer);
+        resolve();
+      });
+      worker.disconnect();
+    });
+
+  cluster.once('listening', () => onReady?.());
+
+  cluster.on('exit', (worker, code, signal) => {
+    const started = startedAt.get(worker);
+    startedAt.delete(worker);
+    if (shuttingDown || worker.exitedAfterDisconnect || pendingReplacements.has(worker)) return;
+
+    // 启动后很快退出，说明可能无法正常启动，逐步加大重启间隔
+    restartDelay =
+      Date.now() - started < CRASH_WINDOW ? Math.min(Math.max(restartDelay * 2, 500), MAX_RESTART_DELAY) : 0;
+    console.warn(`⚠️  工作进程 ${worker.process.pid} 退出（${signal || code}），${restartDelay}ms 后重启`);
+    setTimeout(fork, restartDelay);
+  });
+
+  for (let i = 0; i < workers; i++) fork();
+
+  /**
+   * 等待新进程开始监听；新进程提前退出或超时时失败
+   */
+  async function waitListening(worker) {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), STARTUP_TIMEOUT);
+    try {
+      await Promise.race([
+        once(worker, 'listening', { signal: controller.signal }),
+        once(worker, 'exit', { signal: controller.signal }).then(() => {
+          throw new Error(`新工作进程 ${worker.process.pid} 启动前退出`);
+        })
+      ]);
+    } catch (error) {
+      if (error.name === 'AbortError') {
+        throw new Error(`新工作进程 ${worker.process.pid} ${STARTUP_TIMEOUT}ms 内未开始监听`);
+      }
+      throw error;
+    } finally {
+      clearTimeout(timer);
+      controller.abort();
+    }
+  }
+
+  async function rollingRestart() {
+    if (restarting || shuttingDown) return;
+    restarting = true;
+    console.log('🔄 滚动重启工作进程');
+    try {
+      for (const worker of [...startedAt.keys()]) {
+        const replacement = fork();
+        pendingReplacements.add(replacement);
+        try {
+          await waitListening(replacement);
+        } catch (error) {
+          // 新进程无法启动时保留旧进程，放弃本次滚动重启
+          console.error(`❌ 滚动重启中止：${error.message}`);
+          if (!replacement.isDead()) {
+            const exited = once(replacement, 'exit');
+            replacement.process.kill('SIGKILL');
+            await exited;
+          }
+          return;
+        } finally {
+          pendingReplacements.delete(replacement);
+        }
+        await stop(worker);
+      }
+      console.log('✅ 滚动重启完成');
+    } finally {
+      restarting = false;
+    }
+  }
+
+  async function shutdown() {
+    if (shuttingDown) return;
+    shuttingDown = true;
+    console.log('\n👋 正在关闭服务器…');
+    await Promise.all([...startedAt.keys()].map(stop));
+    process.exit(0);
+  }
+
+  process.on('SIGHUP', rollingRestart);
+  process.on('SIGUSR2', rollingRestart);
+  process.on('SIGINT', shutdown);
+  process.on('SIGTERM', shutdown);
+}
@@ -0,0 +1,285 @@
+/**
+ * 静态资源服务（生产预览）
+ *
+ * - 启动时扫描 dist 建立文件清单，小文件内容常驻内存
+ * - 客户端支持时返回构建时生成的 .br / .gz 预压缩文件（见 scripts/compress-dist.mjs）
+ * - /assets 下带哈希的文件标记为 immutable 长缓存，其余文件使用 ETag 协商缓存
+ * - index.html 常驻内存（含压缩版本），使用强 ETag；重新构建后自动重新加载
+ */
+
+import fs from 'fs';
+import path from 'path';
+import zlib from 'zlib';
+import crypto from 'crypto';
+
+// 常驻内存的文件总大小与单个文件上限，超出的文件按流读取
+const MEMORY_BUDGET = 64 * 1024 * 1024;
+const MAX_MEMORY_FILE = 2 * 1024 * 1024;
+// 重新构建时文件会连续变化，合并为一次重新扫描
+const RELOAD_DELAY = 300;
+
+const IMMUTABLE = 'public, max-age=31536000, immutable';
+const REVALIDATE = 'public, max-age=0, must-revalidate';
+const NO_CACHE = 'no-cache';
+
+// Vite 输出的带哈希文件名，如 /assets/index-DiwrgTda.js
+const HASHED_ASSET = /^\/assets\/.+-[\w-]{8,}\.\w+$/;
+
+const MIME_TYPES = {
+  '.html': 'text/html; charset=utf-8',
+  '.js': 'text/javascript; charset=utf-8',
+  '.mjs': 'text/javascript; charset=utf-8',
+  '.css': 'text/css; charset=utf-8',
+  '.json': 'application/json; charset=utf-8',
+  '.map': 'application/json; charset=utf-8',
+  '.txt': 'text/plain; charset=utf-8',
+  '.xml': 'application/xml; charset=utf-8',
+  '.svg': 'image/svg+xml',
+  '.png': 'image/png',
+  '.jpg': 'image/jpeg',
+  '.jpeg': 'image/jpeg',
+  '.gif': 'image/gif',
+  '.webp': 'image/webp',
+  '.ico': 'image/x-icon',
+  '.woff': 'font/woff',
+  '.woff2': 'font/woff2',
+  '.ttf': 'font/ttf',
+  '.wasm': 'application/wasm'
+};
+
+const ENCODINGS = [
+  { name: 'br', ext: '.br' },
+  { name: 'gzip', ext: '.gz' }
+];
+
+function contentEtag(buffer) {
+  return `"${crypto.createHash('sha1').update(buffer).digest('base64url')}"`;
+}
+
+/**
+ * 递归列出目录下的文件
+ */
+function walk(dir, base = dir, files = []) {
+  for (const dirent of fs.readdirSync(dir, { withFileTypes: true })) {
+    const file = path.join(dir, dirent.name);
+    if (dirent.isDirectory()) walk(file, base, files);
+    else if (dirent.isFile()) files.push(file);
+  }
+  return files;
+}
+
+/**
+ * 解析 Accept-Encoding，返回客户端可接受的编码
+ * @param {string | undefined} header
+ */
+function acceptedEncodings(header) {
+  const accepted = new Set();
+  if (!header) return accepted;
+  for (const part of header.split(',')) {
+    const [name, ...params] = part.trim().toLowerCase().split(';');
+    const q = params.find((p) => p.trim().startsWith('q='));
+    if (!q || Number(q.trim().slice(2)) > 0) accepted.add(name);
+  }
+  return accepted;
+}
+
+function etagMatches(header, etag) {
+  if (!header) return false;
+  return header === '*' || header.split(',').some((tag) => tag.trim().replace(/^W\//, '') === etag);
+}
+
+/**
+ * 创建静态资源服务
+ * @param {string} distDir 构建输出目录
+ * @param {{ onReload?: (files: number) => void }} [options]
+ */
+export function createStaticServer(distDir, { onReload } = {}) {
+  const indexPath = path.join(distDir, 'index.html');
+  /** @type {Map<string, any>} URL 路径 -> 文件信息 */
+  let manifest = new Map();
+  let index = null;
+
+  /**
+   * 读取文件信息（内存预算内的文件同时读入内容）
+   */
+  function load(file, budget) {
+    const stat = fs.statSync(file);
+    const entry = { file, size: stat.size, mtimeMs: stat.mtimeMs, body: null, etag: '' };
+    if (stat.size <= MAX_MEMORY_FILE && budget.used + stat.size <= MEMORY_BUDGET) {
+      entry.body = fs.readFileSync(file);
+      entry.etag = contentEtag(entry.body);
+      budget.used += stat.size;
+    } else {
+      entry.etag = `"${stat.size.toString(16)}-${Math.floor(stat.mtimeMs).toString(16)}"`;
+    }
+    return entry;
+  }
+
+  /**
+   * 扫描构建目录，重建文件清单与 index.html 缓存
+   */
+  function scan() {
+    const next = new Map();
+    const budget = { used: 0 };
+    let files = [];
+    try {
+      files = walk(distDir);
+    } catch {
+      // dist 不存在（尚未构建或正在构建）
+    }
+
+    const names = new Set(files);
+    for (const file of files) {
+      if (ENCODINGS.some(({ ext }) => file.endsWith(ext) && names.has(file.slice(0, -ext.length)))) continue;
+
+      const urlPath = '/' + path.relative(distDir, file).split(path.sep).join('/');
+      const entry = load(file, budget);
+      entry.type = MIME_TYPES[path.extname(file).toLowerCase()] || 'application/octet-stream';
+      entry.cacheControl = HASHED_ASSET.test(urlPath) ? IMMUTABLE : REVALIDATE;
+      entry.variants = {};
+      for (const { name, ext } of ENCODINGS) {
+        if (!names.has(file + ext)) continue;
+        const variant = load(file + ext, budget);
+        // 比原文件旧的压缩文件已过期（原文件重新生成后未重新压缩）
+        if (variant.mtimeMs < entry.mtimeMs) continue;
+        // 不同编码是不同的表示，强 ETag 需要区分
+        variant.etag = entry.etag.slice(0, -1) + `-${name}"`;
+        entry.variants[name] = variant;
+      }
+      next.set(urlPath, entry);
+    }
+
+    manifest = next;
+    index = next.get('/index.html') || null;
+    if (index) {
+      index.cacheControl = NO_CACHE;
+      // 没有预压缩文件时在内存中压缩（index.html 很小）
+      if (!index.body) index.body = fs.readFileSync(indexPath);
+      if (!index.variants.br) {
+        index.variants.br = { body: zlib.brotliCompressSync(index.body), etag: index.etag.slice(0, -1) + '-br"' };
+      }
+      if (!index.variants.gzip) {
+        index.variants.gzip = { body: zlib.gzipSync(index.body, { level: 9 }), etag: index.etag.slice(0, -1) + '-gzip"' };
+      }
+    }
+    onReload?.(next.size);
+  }
+
+  /**
+   * 发送文件
+   */
+  function send(entry, req, res) {
+    const accepted = acceptedEncodings(req.headers['accept-encoding']);
+    const encoding = ENCODINGS.find(({ name }) => entry.variants[name] && accepted.has(name))?.name;
+    const representation = encoding ? entry.variants[encoding] : entry;
+
+    const headers = {
+      'Content-Type': entry.type,
+      'Cache-Control': entry.cacheControl,
+      ETag: representation.etag
+    };
+    if (Object.keys(entry.variants).length > 0) headers.Vary = 'Accept-Encoding';
+
+    if (etagMatches(req.headers['if-none-match'], representation.etag)) {
+      res.writeHead(304, headers);
+      res.end();
+      return;
+    }
+
+    if (encoding) headers['Content-Encoding'] = encoding;
+
+    if (representation.body) {
+      headers['Content-Length'] = representation.body.length;
+      res.writeHead(200, headers);
+      res.end(req.method === 'HEAD' ? undefined : representation.body);
+      return;
+    }
+
+    // 未缓存在内存中的文件从磁盘读取：文件打开后才发送响应头，
+    // 文件已不存在（如重新构建时 dist 被清空）时返回错误，不抛出未捕获的异常
+    const stream = fs.createReadStream(representation.file);
+    res.on('close', () => stream.destroy());
+    stream.on('error', (error) => {
+      if (res.headersSent) {
+        res.destroy(error);
+        return;
+      }
+      const status = error.code === 'ENOENT' ? 404 : 500;
+      res.writeHead(status, { 'Content-Type': 'text/plain; charset=utf-8', 'Cache-Control': NO_CACHE });
+      res.end(status === 404 ? 'Not Found' : 'Internal Server Error');
+    });
+    stream.on('open', (fd) => {
+      fs.fstat(fd, (error, stat) => {
+        if (error) {
+          stream.destroy(error);
+          return;
+        }
+        headers['Content-Length'] = stat.size;
+        res.writeHead(200, headers);
+        if (req.method === 'HEAD') {
+          stream.destroy();
+          res.end();
+        } else {
+          stream.pipe(res);
+        }
+      });
+    });
+  }
+
+  function pathnameOf(req) {
+    try {
+      return decodeURIComponent(req.path);
+    } catch {
+      return null;
+    }
+  }
+
+  /**
+   * 静态文件中间件（未命中时交给后续中间件）
+   */
+  function middleware(req, res, next) {
+    if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+    const pathname = pathnameOf(req);
+    const entry = pathname && manifest.get(pathname === '/' ? '/index.html' : pathname);
+    if (!entry) return next();
+    send(entry, req, res);
+  }
+
+  /**
+   * SPA 路由回退：未匹配的页面路由返回内存中的 index.html
+   */
+  function spaFallback(req, res, next) {
+    if (req.method !== 'GET' && req.method !== 'HEAD') return next();
+    // 缺失的接口与构建资源直接 404，不返回页面
+    if (req.path.startsWith('/api/') || req.path.startsWith('/assets/')) return next();
+
+    if (!index) {
+      res.status(404).send('❌ dist/index.html 不存在，请先执行 pnpm build');
+      return;
+    }
+    send(index, req, res);
+  }
+
+  // 重新构建时 index.html 会被重写，压缩脚本最后写入 index.html.br，两者变化都触发重新扫描
+  let timer = null;
+  const scheduleScan = (curr, prev) => {
+    if (curr.mtimeMs === prev.mtimeMs) return;
+    clearTimeout(timer);
+    timer = setTimeout(scan, RELOAD_DELAY);
+    timer.unref();
+  };
+  // 监听不阻止进程退出（工作进程断开后需要能自然退出）
+  const watched = [indexPath, indexPath + '.br'];
+  watched.forEach((file) => fs.watchFile(file, { interval: 500 }, scheduleScan).unref());
+
+  scan();
+
+  return {
+    middleware,
+    spaFallback,
+    close() {
+      clearTimeout(timer);
+      watched.forEach((file) => fs.unwatchFile(file, scheduleScan));
+    }
+  };
+}
@@ -0,0 +1,42 @@
+/**
+ * 不透明游标
+ * 游标记录上一页最后一条记录的序号和查询条件指纹，
+ * 下一页按序号继续（keyset 分页），条件变化后旧游标失效
+ */
+
+/**
+ * @param {{ after: number, fingerprint: string }} state
+ * @returns {string}
+ */
+export function encodeCursor({ after, fingerprint }) {
+  return btoa(JSON.stringify({ a: after, f: fingerprint }))
+    .replace(/\+/g, '-')
+    .replace(/\//g, '_')
+    .replace(/=+$/, '');
+}
+
+/**
+ * @param {string} cursor
+ * @param {string} fingerprint 当前查询条件指纹
+ * @returns {number} 上一页最后一条记录的序号
+ * @throws {CursorError} 游标无效或与查询条件不符
+ */
+export function decodeCursor(cursor, fingerprint) {
+  let state;
+  try {
+    state = JSON.parse(atob(cursor.replace(/-/g, '+').replace(/_/g, '/')));
+  } catch {
+    throw new CursorError('无效的游标');
+  }
+  if (!Number.isInteger(state?.a) || state.f !== fingerprint) {
+    throw new CursorError('游标与查询条件不匹配');
+  }
+  return state.a;
+}
+
+export class CursorError extends Error {
+  constructor(message) {
+    super(message);
+    this.name = 'CursorError';
+  }
+}
@@ -0,0 +1,73 @@
+/**
+ * Mock 数据
+ * Cloudflare Functions 与 server.js 共用
+ */
+
+export const USERS = {
+  admin: {
+    id: '1',
+    username: 'admin',
+    realName: '管理员',
+    email: 'admin@example.com',
+    avatar: 'https://avatars.githubusercontent.com/u/120364369?s=200&v=4',
+    roles: ['admin'],
+    permissions: [
+      'system:user:list',
+      'system:user:add',
+      'system:user:edit',
+      'system:user:delete',
+      'system:role:list',
+      'system:role:add',
+      'system:role:edit',
+      'system:role:delete',
+      'system:permission:list',
+      'system:permission:add',
+      'system:permission:edit',
+      'system:permission:delete'
+    ]
+  },
+  user: {
+    id: '2',
+    username: 'user',
+    realName: '普通用户',
+    email: 'user@example.com',
+    avatar: 'https://avatars.githubusercontent.com/u/120364369?s=200&v=4',
+    roles: ['user'],
+    permissions: [
+      'system:user:list',
+      'system:user:edit'
+    ]
+  }
+};
+
+export const CREDENTIALS = {
+  admin: { password: 'admin123', token: 'admin_token_12345' },
+  user: { password: 'user123', token: 'user_token_67890' }
+};
+
+export const TOKEN_MAP = Object.fromEntries(
+  Object.entries(CREDENTIALS).map(([username, { token }]) => [token, username])
+);
+
+const DAY = 24 * 60 * 60 * 1000;
+
+/**
+ * 生成用户列表数据
+ * 创建时间由序号推算（最近 30 天内），同一天内多次生成结果一致，保证 ETag 稳定
+ * @param {number} count 数量
+ */
+export function generateMockUsers(count = 100) {
+  const today = Math.floor(Date.now() / DAY) * DAY;
+  const users = [];
+  for (let i = 1; i <= count; i++) {
+    users.push({
+      id: `${i}`,
+      username: `user${i}`,
+      realName: `用户${i}`,
+      email: `user${i}@example.com`,
+      status: i % 2 === 0 ? 'active' : 'inactive',
+      createTime: new Date(today - ((i * 7919) % 30) * DAY).toISOString().split('T')[0]
+    });
+  }
+  return users;
+}
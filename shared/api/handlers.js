@@ -0,0 +1,174 @@
+/**
+ * API 处理函数
+ * 基于 Web 标准 Request / Response，Cloudflare Functions 直接调用，server.js 经适配后调用
+ */
+
+import { USERS, CREDENTIALS, TOKEN_MAP } from './fixtures.js';
+import { encodeCursor, decodeCursor, CursorError } from './cursor.js';
+import { cachedJson, hashString } from './httpCache.js';
+
+// 边缘缓存键使用的虚拟源站（只用于拼接缓存键，不会被请求）
+const CACHE_ORIGIN = 'https://api-cache.internal';
+// 边缘缓存时间（秒）
+const LIST_TTL = 30;
+const INFO_TTL = 60;
+const MAX_PAGE_SIZE = 100;
+
+function json(body, status = 200) {
+  return new Response(JSON.stringify(body), {
+    status,
+    headers: { 'Content-Type': 'application/json' }
+  });
+}
+
+function methodNotAllowed() {
+  return new Response('Method not allowed', { status: 405 });
+}
+
+function serverError() {
+  return json({ code: 500, data: null, message: '服务器错误' }, 500);
+}
+
+// 用户信息的 ETag 只与用户数据有关，按用户缓存
+const userEtags = new Map();
+function userEtag(username) {
+  let etag = userEtags.get(username);
+  if (!etag) {
+    etag = `"${hashString(JSON.stringify(USERS[username]))}"`;
+    userEtags.set(username, etag);
+  }
+  return etag;
+}
+
+/**
+ * 创建 API
+ * @param {{ storage: import('./storage.js').MemoryStorage | import('./storage.js').SqlStorage }} options
+ */
+export function createApi({ storage }) {
+  /**
+   * 登录接口
+   */
+  async function login(request) {
+    if (request.method !== 'POST') return methodNotAllowed();
+
+    try {
+      const { username, password } = await request.json();
+      const credential = CREDENTIALS[username];
+      if (credential && credential.password === password) {
+        return json({
+          code: 0,
+          data: { token: credential.token, user: USERS[username] },
+          message: '登录成功'
+        });
+      }
+      return json({ code: 401, data: null, message: '用户名或密码错误' }, 401);
+    } catch (error) {
+      return serverError();
+    }
+  }
+
+  /**
+   * 获取当前用户信息接口
+   */
+  async function info(request, ctx) {
+    if (request.method !== 'GET') return methodNotAllowed();
+
+    try {
+      const token = (request.headers.get('authorization') || '').replace('Bearer ', '').trim();
+      const username = TOKEN_MAP[token];
+      if (!username || !USERS[username]) {
+        return json({ code: 401, data: null, message: 'Token无效或已过期' }, 401);
+      }
+
+      // 缓存键按用户名区分，不包含 Token
+      return await cachedJson(request, {
+        cacheKey: `${CACHE_ORIGIN}/api/user/info?u=${encodeURIComponent(username)}`,
+        etag: userEtag(username),
+        ttl: INFO_TTL,
+        ctx,
+        build: async () => ({ code: 0, data: USERS[username], message: '获取成功' })
+      });
+    } catch (error) {
+      return serverError();
+    }
+  }
+
+  /**
+   * 登出接口
+   */
+  async function logout(request) {
+    if (request.method !== 'POST') return methodNotAllowed();
+    return json({ code: 0, data: null, message: '登出成功' });
+  }
+
+  /**
+   * 获取用户列表接口
+   * 参数：search、status、pageSize，以及 page（页码分页）或 cursor（游标分页，优先）
+   * 返回的 nextCursor 用于获取下一页，没有下一页时为 null
+   */
+  async function listUsers(request, ctx) {
+    if (request.method !== 'GET') return methodNotAllowed();
+
+    try {
+      const url = new URL(request.url);
+      const params = url.searchParams;
+      const page = Math.max(parseInt(params.get('page')) || 1, 1);
+      const pageSize = Math.min(Math.max(parseInt(params.get('pageSize')) || 10, 1), MAX_PAGE_SIZE);
+      const search = (params.get('search') || '').trim().toLowerCase();
+      const status = params.get('status') || '';
+      const cursor = params.get('cursor');
+
+      const fingerprint = hashString(`${status}\n${search}`);
+      let after;
+      if (cursor) {
+        try {
+          after = decodeCursor(cursor, fingerprint);
+        } catch (error) {
+          if (error instanceof CursorError) {
+            return json({ code: 400, data: null, message: error.message }, 400);
+          }
+          throw error;
+        }
+      }
+
+      await storage.init();
+      const version = await storage.version();
+      const key = new URLSearchParams({ v: version, search, status, pageSize: String(pageSize) });
+      if (cursor) key.set('cursor', cursor);
+      else key.set('page', String(page));
+      const cacheKey = `${CACHE_ORIGIN}/api/user/list?${key}`;
+
+      return await cachedJson(request, {
+        cacheKey,
+        etag: `"${version}-${hashString(cacheKey)}"`,
+        ttl: LIST_TTL,
+        ctx,
+        build: async () => {
+          const result = await storage.listUsers({
+            search,
+            status,
+            after,
+            offset: (page - 1) * pageSize,
+            limit: pageSize
+          });
+          return {
+            code: 0,
+            data: {
+              list: result.list,
+              page: cursor ? undefined : page,
+              pageSize,
+              total: result.total,
+              pageCount: Math.ceil(result.total / pageSize),
+              nextCursor: result.hasMore ? encodeCursor({ after: result.last, fingerprint }) : null
+            },
+            message: '获取成功'
+          };
+        }
+      });
+    } catch (error) {
+      return serverError();
+    }
+  }
+
+  return { login, info, logout, listUsers };
+}
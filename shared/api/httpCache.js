@@ -0,0 +1,133 @@
+/**
+ * HTTP 缓存
+ * - ETag / If-None-Match：条件请求命中时返回 304，不再生成响应体
+ * - 边缘缓存：Cloudflare 中使用 Cache API（caches.default），
+ *   Node 中使用接口相同的内存缓存 MemoryCache
+ */
+
+/**
+ * 字符串哈希（两路 FNV-1a，16 位十六进制）
+ * @param {string} text
+ */
+export function hashString(text) {
+  let h1 = 0x811c9dc5;
+  let h2 = 0x01000193;
+  for (let i = 0; i < text.length; i++) {
+    const c = text.charCodeAt(i);
+    h1 = Math.imul(h1 ^ c, 0x01000193);
+    h2 = Math.imul(h2 ^ c, 0x811c9dc5);
+  }
+  return (h1 >>> 0).toString(16).padStart(8, '0') + (h2 >>> 0).toString(16).padStart(8, '0');
+}
+
+/**
+ * 请求的 If-None-Match 是否与 ETag 匹配
+ * @param {Request} request
+ * @param {string} etag
+ */
+export function etagMatches(request, etag) {
+  const header = request.headers.get('if-none-match');
+  if (!header) return false;
+  if (header.trim() === '*') return true;
+  return header.split(',').some((tag) => tag.trim().replace(/^W\//, '') === etag);
+}
+
+/**
+ * 内存缓存（Cache API 的子集：match / put / delete）
+ * 过期时间取自响应的 Cache-Control max-age，超过容量时淘汰最久未使用的条目
+ */
+export class MemoryCache {
+  constructor(maxEntries = 1000) {
+    this.maxEntries = maxEntries;
+    /** @type {Map<string, { status: number, headers: [string, string][], body: ArrayBuffer, expires: number }>} */
+    this.entries = new Map();
+  }
+
+  async match(request) {
+    const key = typeof request === 'string' ? request : request.url;
+    const entry = this.entries.get(key);
+    if (!entry) return undefined;
+    if (entry.expires <= Date.now()) {
+      this.entries.delete(key);
+      return undefined;
+    }
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    return new Response(entry.body, { status: entry.status, headers: entry.headers });
+  }
+
+  async put(request, response) {
+    const key = typeof request === 'string' ? request : request.url;
+    const maxAge = /max-age=(\d+)/.exec(response.headers.get('cache-control') || '');
+    if (!maxAge) return;
+
+    this.entries.delete(key);
+    this.entries.set(key, {
+      status: response.status,
+      headers: [...response.headers],
+      body: await response.arrayBuffer(),
+      expires: Date.now() + Number(maxAge[1]) * 1000
+    });
+    if (this.entries.size > this.maxEntries) {
+      this.entries.delete(this.entries.keys().next().value);
+    }
+  }
+
+  async delete(request) {
+    return this.entries.delete(typeof request === 'string' ? request : request.url);
+  }
+}
+
+let fallbackCache = null;
+
+/**
+ * 边缘缓存：Cloudflare 中为 caches.default，其他环境为进程内 MemoryCache
+ */
+export function getEdgeCache() {
+  if (typeof caches !== 'undefined' && caches.default) {
+    return caches.default;
+  }
+  fallbackCache ??= new MemoryCache();
+  return fallbackCache;
+}
+
+/**
+ * 返回带 ETag 和边缘缓存的 JSON 响应
+ * @param {Request} request
+ * @param {Object} options
+ * @param {string} options.cacheKey 边缘缓存键（URL，需包含数据版本等全部影响响应的因素）
+ * @param {string} options.etag ETag（由缓存键推算，无需生成响应体即可判断 304）
+ * @param {number} options.ttl 边缘缓存时间（秒）
+ * @param {() => Promise<any>} options.build 生成响应数据
+ * @param {string} [options.cacheControl] 返回给浏览器的 Cache-Control
+ * @param {{ waitUntil?: (promise: Promise<any>) => void }} [options.ctx] 运行时上下文
+ */
+export async function cachedJson(request, { cacheKey, etag, ttl, build, cacheControl = 'private, no-cache', ctx }) {
+  const headers = {
+    'Content-Type': 'application/json',
+    'Cache-Control': cacheControl,
+    ETag: etag
+  };
+
+  if (etagMatches(request, etag)) {
+    return new Response(null, { status: 304, headers });
+  }
+
+  const cache = getEdgeCache();
+  const cached = await cache.match(cacheKey);
+  if (cached) {
+    return new Response(cached.body, { status: 200, headers: { ...headers, 'X-Cache': 'HIT' } });
+  }
+
+  const body = JSON.stringify(await build());
+  const store = cache.put(
+    cacheKey,
+    new Response(body, {
+      headers: { 'Content-Type': 'application/json', 'Cache-Control': `public, max-age=${ttl}` }
+    })
+  );
+  if (ctx?.waitUntil) ctx.waitUntil(store);
+  else await store;
+
+  return new Response(body, { status: 200, headers: { ...headers, 'X-Cache': 'MISS' } });
+}
@@ -0,0 +1,30 @@
+/**
+ * 共享 API 模块
+ * Cloudflare Functions（functions/api）与生产预览服务器（server.js）共用同一份数据与处理逻辑
+ */
+
+import { createApi } from './handlers.js';
+import { MemoryStorage, SqlStorage } from './storage.js';
+import { generateMockUsers } from './fixtures.js';
+
+export { createApi } from './handlers.js';
+export { MemoryStorage, SqlStorage, createSqliteD1 } from './storage.js';
+export { generateMockUsers } from './fixtures.js';
+
+// 模拟用户数量
+export const MOCK_USER_COUNT = 100;
+
+let api = null;
+
+/**
+ * 获取 API 实例（每个运行实例只创建一次，数据与索引在请求间复用）
+ * @param {{ DB?: object }} [env] Cloudflare 环境变量；绑定了 D1 数据库 DB 时使用 SQL 存储
+ */
+export function getApi(env = {}) {
+  if (!api) {
+    const users = generateMockUsers(MOCK_USER_COUNT);
+    const storage = env.DB ? new SqlStorage(env.DB, users) : new MemoryStorage(users);
+    api = createApi({ storage });
+  }
+  return api;
+}
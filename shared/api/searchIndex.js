@@ -0,0 +1,104 @@
+/**
+ * 前缀/分词搜索索引
+ *
+ * 每个字段值按非字母数字字符切分为词，同时保留完整字段值作为一个词；
+ * 查询同样切分，每个查询词都需要是某个词的前缀（多个查询词为“且”关系）。
+ * 例如 "user1@ex" 可以匹配 email 为 user1@example.com 的记录。
+ */
+
+const SPLITTER = /[^\p{L}\p{N}]+/u;
+
+/**
+ * 切分文本为词（小写、去重）
+ * @param {string} text
+ * @param {boolean} [withWhole] 是否包含完整文本
+ * @returns {string[]}
+ */
+export function tokenize(text, withWhole = false) {
+  const value = String(text ?? '').trim().toLowerCase();
+  if (!value) return [];
+  const tokens = new Set(value.split(SPLITTER).filter(Boolean));
+  if (withWhole) tokens.add(value);
+  return [...tokens];
+}
+
+/**
+ * 记录的全部索引词
+ * @param {Record<string, any>} row
+ * @param {string[]} fields
+ */
+export function rowTokens(row, fields) {
+  const tokens = new Set();
+  for (const field of fields) {
+    for (const token of tokenize(row[field], true)) tokens.add(token);
+  }
+  return [...tokens];
+}
+
+export class SearchIndex {
+  /**
+   * @param {Record<string, any>[]} rows 记录（下标即记录编号）
+   * @param {string[]} fields 搜索字段
+   */
+  constructor(rows, fields) {
+    /** @type {Map<string, number[]>} 词 -> 记录编号（升序） */
+    const postings = new Map();
+    rows.forEach((row, index) => {
+      for (const token of rowTokens(row, fields)) {
+        let list = postings.get(token);
+        if (!list) {
+          list = [];
+          postings.set(token, list);
+        }
+        list.push(index);
+      }
+    });
+
+    this.size = rows.length;
+    this.postings = postings;
+    // 有序词表，前缀查找时二分定位
+    this.tokens = [...postings.keys()].sort();
+  }
+
+  /**
+   * 搜索
+   * @param {string} text 查询文本
+   * @returns {Uint8Array | null} 命中标记（下标为记录编号）；查询为空时返回 null
+   */
+  search(text) {
+    const queryTokens = tokenize(text);
+    if (queryTokens.length === 0) return null;
+
+    let result = null;
+    for (const prefix of queryTokens) {
+      const marks = this.prefixMarks(prefix);
+      if (result) {
+        for (let i = 0; i < result.length; i++) result[i] &= marks[i];
+      } else {
+        result = marks;
+      }
+    }
+    return result;
+  }
+
+  /**
+   * 以 prefix 开头的全部词对应的记录
+   */
+  prefixMarks(prefix) {
+    const marks = new Uint8Array(this.size);
+    const tokens = this.tokens;
+
+    let lo = 0;
+    let hi = tokens.length;
+    while (lo < hi) {
+      const mid = (lo + hi) >>> 1;
+      if (tokens[mid] < prefix) lo = mid + 1;
+      else hi = mid;
+    }
+
+    for (let i = lo; i < tokens.length && tokens[i].startsWith(prefix); i++) {
+      for (const index of this.postings.get(tokens[i])) marks[index] = 1;
+    }
+    return marks;
+  }
+}
@@ -0,0 +1,297 @@
+/**
+ * 数据存储适配器
+ *
+ * - MemoryStorage：内存存储，启动时建立搜索索引
+ * - SqlStorage：D1 兼容的 SQL 存储（Cloudflare D1，或经 createSqliteD1 包装的本地 SQLite）
+ *
+ * 两者提供相同的接口：
+ *   init()             初始化（建表、写入种子数据）
+ *   version()          数据版本，由数据内容计算，相同数据在各进程/实例中一致，用于 ETag 与边缘缓存键
+ *   listUsers(query)   查询用户列表
+ *
+ * @typedef {Object} UserQuery
+ * @property {string} [search]  搜索文本（前缀/分词匹配）
+ * @property {string} [status]  状态
+ * @property {number} [after]   游标分页：返回序号大于 after 的记录
+ * @property {number} [offset]  页码分页：跳过的记录数
+ * @property {number} limit     每页数量
+ *
+ * @typedef {Object} UserPage
+ * @property {object[]} list
+ * @property {number} total
+ * @property {number | null} last  本页最后一条记录的序号
+ * @property {boolean} hasMore     之后是否还有记录
+ */
+
+import { SearchIndex, rowTokens, tokenize } from './searchIndex.js';
+import { hashString } from './httpCache.js';
+
+export const SEARCH_FIELDS = ['username', 'realName', 'email'];
+
+// 过滤结果缓存数量（同一条件翻页时复用）
+const MAX_CACHED_MATCHES = 50;
+
+/**
+ * 数据版本：数据内容的哈希
+ * @param {object[]} users
+ */
+export function dataVersion(users) {
+  return hashString(JSON.stringify(users));
+}
+
+export class MemoryStorage {
+  /**
+   * @param {object[]} users 用户数据（按序号排列，序号从 1 开始）
+   */
+  constructor(users) {
+    this.users = users;
+    this.index = new SearchIndex(users, SEARCH_FIELDS);
+    this.dataVersion = dataVersion(users);
+    /** @type {Map<string, Int32Array>} */
+    this.matches = new Map();
+  }
+
+  async init() {}
+
+  async version() {
+    return this.dataVersion;
+  }
+
+  /**
+   * @param {UserQuery} query
+   * @returns {Promise<UserPage>}
+   */
+  async listUsers({ search = '', status = '', after, offset = 0, limit }) {
+    const matches = this.match(search, status);
+
+    let start = offset;
+    if (after !== undefined) {
+      // 序号 = 下标 + 1，且 matches 升序，二分查找第一个序号大于 after 的位置
+      let lo = 0;
+      let hi = matches.length;
+      while (lo < hi) {
+        const mid = (lo + hi) >>> 1;
+        if (matches[mid] + 1 <= after) lo = mid + 1;
+        else hi = mid;
+      }
+      start = lo;
+    }
+
+    const page = matches.subarray(start, start + limit);
+    return {
+      list: Array.from(page, (index) => this.users[index]),
+      total: matches.length,
+      last: page.length > 0 ? page[page.length - 1] + 1 : null,
+      hasMore: start + limit < matches.length
+    };
+  }
+
+  /**
+   * 符合条件的记录下标（升序）
+   */
+  match(search, status) {
+    const key = `${status}\n${search}`;
+    const cached = this.matches.get(key);
+    if (cached) {
+      // LRU：移到末尾
+      this.matches.delete(key);
+      this.matches.set(key, cached);
+      return cached;
+    }
+
+    const marks = this.index.search(search);
+    const result = [];
+    this.users.forEach((user, index) => {
+      if (marks && !marks[index]) return;
+      if (status && user.status !== status) return;
+      result.push(index);
+    });
+
+    const matches = Int32Array.from(result);
+    this.matches.set(key, matches);
+    if (this.matches.size > MAX_CACHED_MATCHES) {
+      this.matches.delete(this.matches.keys().next().value);
+    }
+    return matches;
+  }
+}
+
+const SCHEMA = [
+  `CREATE TABLE IF NOT EXISTS users (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL,
+    username TEXT NOT NULL,
+    real_name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    status TEXT NOT NULL,
+    create_time TEXT NOT NULL
+  )`,
+  `CREATE INDEX IF NOT EXISTS idx_users_status ON users (status, seq)`,
+  `CREATE TABLE IF NOT EXISTS user_tokens (
+    token TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (token, seq)
+  ) WITHOUT ROWID`,
+  `CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)`
+];
+
+// 批量写入时每批的语句数
+const BATCH_SIZE = 100;
+
+export class SqlStorage {
+  /**
+   * @param {object} db D1 数据库（或 createSqliteD1 包装的本地 SQLite）
+   * @param {object[]} seed 表为空时写入的种子数据
+   */
+  constructor(db, seed = []) {
+    this.db = db;
+    this.seed = seed;
+    this.ready = null;
+  }
+
+  /**
+   * 建表并写入种子数据（每个实例只执行一次，失败时允许重试）
+   */
+  init() {
+    if (!this.ready) {
+      this.ready = this.setup().catch((error) => {
+        this.ready = null;
+        throw error;
+      });
+    }
+    return this.ready;
+  }
+
+  async setup() {
+    await this.db.batch(SCHEMA.map((sql) => this.db.prepare(sql)));
+
+    const row = await this.db.prepare('SELECT COUNT(*) AS count FROM users').first();
+    if (row.count > 0 || this.seed.length === 0) return;
+
+    const statements = [];
+    this.seed.forEach((user, index) => {
+      const seq = index + 1;
+      statements.push(
+        this.db
+          .prepare(
+            'INSERT INTO users (seq, id, username, real_name, email, status, create_time) VALUES (?, ?, ?, ?, ?, ?, ?)'
+          )
+          .bind(seq, user.id, user.username, user.realName, user.email, user.status, user.createTime)
+      );
+      for (const token of rowTokens(user, SEARCH_FIELDS)) {
+        statements.push(this.db.prepare('INSERT INTO user_tokens (token, seq) VALUES (?, ?)').bind(token, seq));
+      }
+    });
+    statements.push(
+      this.db
+        .prepare("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)")
+        .bind(dataVersion(this.seed))
+    );
+
+    for (let i = 0; i < statements.length; i += BATCH_SIZE) {
+      await this.db.batch(statements.slice(i, i + BATCH_SIZE));
+    }
+  }
+
+  async version() {
+    const row = await this.db.prepare("SELECT value FROM meta WHERE key = 'version'").first();
+    return row?.value || '0';
+  }
+
+  /**
+   * @param {UserQuery} query
+   * @returns {Promise<UserPage>}
+   */
+  async listUsers({ search = '', status = '', after, offset = 0, limit }) {
+    const where = [];
+    const params = [];
+
+    // 每个查询词：存在以其为前缀的索引词（走 user_tokens 主键的范围扫描）
+    for (const prefix of tokenize(search)) {
+      where.push('seq IN (SELECT seq FROM user_tokens WHERE token >= ? AND token < ?)');
+      params.push(prefix, `${prefix}\uffff`);
+    }
+    if (status) {
+      where.push('status = ?');
+      params.push(status);
+    }
+
+    const filter = where.length > 0 ? `WHERE ${where.join(' AND ')}` : '';
+    const pageFilter =
+      after !== undefined ? (filter ? `${filter} AND seq > ?` : 'WHERE seq > ?') : filter;
+    const pageParams = after !== undefined ? [...params, after] : params;
+
+    // 多取一条用于判断是否还有下一页
+    const [countRow, pageRows] = await Promise.all([
+      this.db.prepare(`SELECT COUNT(*) AS total FROM users ${filter}`).bind(...params).first(),
+      this.db
+        .prepare(
+          `SELECT seq, id, username, real_name, email, status, create_time FROM users ${pageFilter} ORDER BY seq LIMIT ? OFFSET ?`
+        )
+        .bind(...pageParams, limit + 1, after !== undefined ? 0 : offset)
+        .all()
+    ]);
+
+    const rows = pageRows.results.slice(0, limit);
+    return {
+      list: rows.map((row) => ({
+        id: row.id,
+        username: row.username,
+        realName: row.real_name,
+        email: row.email,
+        status: row.status,
+        createTime: row.create_time
+      })),
+      total: countRow.total,
+      last: rows.length > 0 ? rows[rows.length - 1].seq : null,
+      hasMore: pageRows.results.length > limit
+    };
+  }
+}
+
+/**
+ * 将本地 SQLite 连接包装为 D1 接口
+ * @param {object} database node:sqlite 的 DatabaseSync（或 API 相同的 better-sqlite3 连接）
+ */
+export function createSqliteD1(database) {
+  // 预编译语句按 SQL 复用
+  const compiled = new Map();
+  const compile = (sql) => {
+    let statement = compiled.get(sql);
+    if (!statement) {
+      statement = database.prepare(sql);
+      compiled.set(sql, statement);
+    }
+    return statement;
+  };
+
+  const prepare = (sql, args = []) => ({
+    bind: (...values) => prepare(sql, values),
+    async all() {
+      return { results: compile(sql).all(...args) };
+    },
+    async first() {
+      return compile(sql).get(...args) ?? null;
+    },
+    async run() {
+      compile(sql).run(...args);
+      return { success: true };
+    }
+  });
+
+  return {
+    prepare: (sql) => prepare(sql),
+    async batch(statements) {
+      database.exec('BEGIN');
+      try {
+        const results = [];
+        for (const statement of statements) results.push(await statement.run());
+        database.exec('COMMIT');
+        return results;
+      } catch (error) {
+        database.exec('ROLLBACK');
+        throw error;
+      }
+    }
+  };
+}
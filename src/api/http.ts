@@ -3,8 +3,80 @@ import type { AxiosInstance, AxiosRequestConfig } from 'axios'
 import { useUserStore } from '@/store/modules/user'
 import type { ApiResponse } from './types'
 
+/**
+ * 请求缓存策略（按请求开启）
+ */
+export interface RequestCachePolicy {
+  /** 缓存键，默认由 method + url + params 生成 */
+  key?: string
+  /** 合并相同的进行中请求，默认 true */
+  dedupe?: boolean
+  /** 响应缓存有效期（毫秒），0 表示只合并请求不缓存响应 */
+  ttl?: number
+  /** 过期后仍可直接返回旧数据、同时后台刷新的时间窗口（毫秒） */
+  staleWhileRevalidate?: number
+  /** 缓存标签，可通过 invalidate 按标签失效 */
+  tags?: string[]
+}
+
+/**
+ * 扩展的请求配置
+ */
+export interface RequestConfig extends AxiosRequestConfig {
+  /** GET 请求的缓存策略，true 等价于 { dedupe: true } */
+  cache?: boolean | RequestCachePolicy
+  /** 取消键：同一键的新请求会中止上一个未完成的请求 */
+  cancelKey?: string
+  /** 请求成功后需要失效的缓存（URL 前缀、标签或正则） */
+  invalidate?: Array<string | RegExp>
+}
+
+/**
+ * 缓存条目
+ */
+interface CacheEntry {
+  url: string
+  tags: string[]
+  data: ApiResponse<any>
+  /** 写入时间 */
+  time: number
+  ttl: number
+  staleWhileRevalidate: number
+}
+
+type InvalidateListener = (patterns: Array<string | RegExp>) => void
+
+/** 响应缓存最大条目数 */
+const MAX_CACHE_ENTRIES = 100
+
+/**
+ * 稳定序列化参数（对象键排序），保证相同参数生成相同的缓存键
+ */
+function stableStringify(value: any): string {
+  if (value === null || value === undefined) return ''
+  if (typeof value !== 'object') return String(value)
+  if (Array.isArray(value)) {
+    return `[${value.map(stableStringify).join(',')}]`
+  }
+  return `{${Object.keys(value)
+    .filter((k) => value[k] !== undefined && value[k] !== null && value[k] !== '')
+    .sort()
+    .map((k) => `${k}:${stableStringify(value[k])}`)
+    .join(',')}}`
+}
+
 class HttpClient {
   private instance: AxiosInstance
+  /** 进行中的请求（用于合并相同请求） */
+  private inflight = new Map<string, Promise<ApiResponse<any>>>()
+  /** 响应缓存（Map 插入顺序即 LRU 顺序） */
+  private cache = new Map<string, CacheEntry>()
+  /** 按取消键记录的 AbortController */
+  private controllers = new Map<string, AbortController>()
+  /** 失效监听器 */
+  private invalidateListeners = new Set<InvalidateListener>()
+  /** 失效代次：请求期间发生失效时，不再写入缓存 */
+  private generation = 0
 
   constructor() {
     this.instance = axios.create({
@@ -54,6 +126,11 @@ class HttpClient {
         }
       },
       (error) => {
+        // 被主动取消的请求不作为错误处理
+        if (axios.isCancel(error)) {
+          return Promise.reject(error)
+        }
+
         // 处理网络错误
         if (error.response) {
           const status = error.response.status
@@ -88,29 +165,233 @@ class HttpClient {
     )
   }
 
-  request<T = any>(config: AxiosRequestConfig): Promise<ApiResponse<T>> {
-    return this.instance.request(config)
+  request<T = any>(config: RequestConfig): Promise<ApiResponse<T>> {
+    const { cache, cancelKey, invalidate, ...axiosConfig } = config
+    const method = (axiosConfig.method || 'GET').toUpperCase()
+
+    let promise: Promise<ApiResponse<T>>
+    if (cache && method === 'GET') {
+      const policy = cache === true ? {} : cache
+      promise = this.cachedRequest<T>(axiosConfig, policy, cancelKey)
+    } else {
+      promise = this.send<T>(axiosConfig, cancelKey)
+    }
+
+    if (invalidate && invalidate.length > 0) {
+      return promise.then((res) => {
+        this.invalidate(...invalidate)
+        return res
+      })
+    }
+    return promise
   }
 
-  get<T = any>(url: string, config?: AxiosRequestConfig): Promise<ApiResponse<T>> {
+  get<T = any>(url: string, config?: RequestConfig): Promise<ApiResponse<T>> {
     return this.request<T>({ ...config, method: 'GET', url })
   }
 
-  post<T = any>(url: string, data?: any, config?: AxiosRequestConfig): Promise<ApiResponse<T>> {
+  post<T = any>(url: string, data?: any, config?: RequestConfig): Promise<ApiResponse<T>> {
     return this.request<T>({ ...config, method: 'POST', url, data })
   }
 
-  put<T = any>(url: string, data?: any, config?: AxiosRequestConfig): Promise<ApiResponse<T>> {
+  put<T = any>(url: string, data?: any, config?: RequestConfig): Promise<ApiResponse<T>> {
     return this.request<T>({ ...config, method: 'PUT', url, data })
   }
 
-  patch<T = any>(url: string, data?: any, config?: AxiosRequestConfig): Promise<ApiResponse<T>> {
+  patch<T = any>(url: string, data?: any, config?: RequestConfig): Promise<ApiResponse<T>> {
     return this.request<T>({ ...config, method: 'PATCH', url, data })
   }
 
-  delete<T = any>(url: string, config?: AxiosRequestConfig): Promise<ApiResponse<T>> {
+  delete<T = any>(url: string, config?: RequestConfig): Promise<ApiResponse<T>> {
     return this.request<T>({ ...config, method: 'DELETE', url })
   }
+
+  /**
+   * 使匹配的缓存失效
+   * @param patterns - URL 前缀、缓存标签或正则；不传则清空全部缓存
+   */
+  invalidate(...patterns: Array<string | RegExp>) {
+    this.generation++
+
+    if (patterns.length === 0) {
+      this.cache.clear()
+      this.inflight.clear()
+    } else {
+      for (const [key, entry] of this.cache) {
+        if (patterns.some((p) => this.matches(p, entry.url, entry.tags))) {
+          this.cache.delete(key)
+        }
+      }
+      // 进行中的请求不再被后续调用复用
+      for (const key of this.inflight.keys()) {
+        if (patterns.some((p) => (typeof p === 'string' ? key.includes(` ${p}`) : p.test(key)))) {
+          this.inflight.delete(key)
+        }
+      }
+    }
+
+    this.invalidateListeners.forEach((listener) => listener(patterns))
+  }
+
+  /**
+   * 注册缓存失效钩子
+   * @returns 取消注册函数
+   */
+  onInvalidate(listener: InvalidateListener): () => void {
+    this.invalidateListeners.add(listener)
+    return () => this.invalidateListeners.delete(listener)
+  }
+
+  /**
+   * 清空所有缓存（登录 / 登出时调用）
+   */
+  clearCache() {
+    this.invalidate()
+  }
+
+  /**
+   * 取消指定取消键的进行中请求
+   */
+  cancel(cancelKey: string) {
+    this.controllers.get(cancelKey)?.abort()
+    this.controllers.delete(cancelKey)
+  }
+
+  /**
+   * 判断错误是否由请求取消引起
+   */
+  isCancel(error: unknown): boolean {
+    return axios.isCancel(error)
+  }
+
+  /**
+   * 发送请求，处理取消键
+   */
+  private send<T>(config: AxiosRequestConfig, cancelKey?: string): Promise<ApiResponse<T>> {
+    if (!cancelKey) {
+      return this.instance.request(config)
+    }
+
+    // 中止同一取消键的上一个请求
+    this.controllers.get(cancelKey)?.abort()
+    const controller = new AbortController()
+    this.controllers.set(cancelKey, controller)
+
+    const promise = this.instance.request(
+      { ...config, signal: config.signal || controller.signal }
+    ) as Promise<ApiResponse<T>>
+
+    return promise.finally(() => {
+      if (this.controllers.get(cancelKey) === controller) {
+        this.controllers.delete(cancelKey)
+      }
+    })
+  }
+
+  /**
+   * 带缓存的 GET 请求：请求合并 + LRU/TTL 缓存 + stale-while-revalidate
+   * @description 每次调用都返回结果的副本，调用方修改结果不会影响缓存和其他调用方
+   */
+  private cachedRequest<T>(
+    config: AxiosRequestConfig,
+    policy: RequestCachePolicy,
+    cancelKey?: string
+  ): Promise<ApiResponse<T>> {
+    return this.cachedResponse<T>(config, policy, cancelKey).then((res) => structuredClone(res))
+  }
+
+  private cachedResponse<T>(
+    config: AxiosRequestConfig,
+    policy: RequestCachePolicy,
+    cancelKey?: string
+  ): Promise<ApiResponse<T>> {
+    const key = policy.key || `GET ${config.url || ''} ${stableStringify(config.params)}`
+
+    const entry = this.cache.get(key)
+    if (entry) {
+      const age = Date.now() - entry.time
+      if (age < entry.ttl + entry.staleWhileRevalidate) {
+        // 命中缓存，刷新 LRU 顺序
+        this.cache.delete(key)
+        this.cache.set(key, entry)
+
+        if (age >= entry.ttl) {
+          // 已过期但在 stale 窗口内：先返回旧数据，后台刷新
+          // 后台刷新不使用调用方的取消键，避免与前台请求互相中止
+          this.fetchAndStore<T>(key, config, policy, undefined, true).catch(() => {})
+        }
+        return Promise.resolve(entry.data as ApiResponse<T>)
+      }
+      this.cache.delete(key)
+    }
+
+    return this.fetchAndStore<T>(key, config, policy, cancelKey, policy.dedupe !== false)
+  }
+
+  /**
+   * 发起请求并写入缓存
+   */
+  private fetchAndStore<T>(
+    key: string,
+    config: AxiosRequestConfig,
+    policy: RequestCachePolicy,
+    cancelKey: string | undefined,
+    dedupe: boolean
+  ): Promise<ApiResponse<T>> {
+    const pending = this.inflight.get(key)
+    if (dedupe && pending) {
+      return pending as Promise<ApiResponse<T>>
+    }
+
+    const generation = this.generation
+    const promise = this.send<T>(config, cancelKey)
+      .then((res) => {
+        const ttl = policy.ttl || 0
+        const staleWhileRevalidate = policy.staleWhileRevalidate || 0
+        if (ttl + staleWhileRevalidate > 0 && generation === this.generation) {
+          this.store(key, {
+            url: config.url || '',
+            tags: policy.tags || [],
+            data: res,
+            time: Date.now(),
+            ttl,
+            staleWhileRevalidate
+          })
+        }
+        return res
+      })
+      .finally(() => {
+        if (this.inflight.get(key) === promise) {
+          this.inflight.delete(key)
+        }
+      })
+
+    this.inflight.set(key, promise)
+    return promise
+  }
+
+  /**
+   * 写入缓存，超出容量时淘汰最久未使用的条目
+   */
+  private store(key: string, entry: CacheEntry) {
+    this.cache.delete(key)
+    this.cache.set(key, entry)
+    while (this.cache.size > MAX_CACHE_ENTRIES) {
+      const oldest = this.cache.keys().next().value
+      if (oldest === undefined) break
+      this.cache.delete(oldest)
+    }
+  }
+
+  /**
+   * 判断缓存条目是否匹配失效规则
+   */
+  private matches(pattern: string | RegExp, url: string, tags: string[]): boolean {
+    if (typeof pattern === 'string') {
+      return url.startsWith(pattern) || tags.includes(pattern)
+    }
+    return pattern.test(url)
+  }
 }
 
 export const http = new HttpClient()
@@ -48,6 +48,7 @@ export interface RouteItem {
     icon?: string
     requiresAuth?: boolean
     roles?: string[]
+    hideInMenu?: boolean
   }
   children?: RouteItem[]
 }
@@ -9,20 +9,26 @@ export const userApi = {
    * 登录
    */
   login(params: LoginRequest) {
-    return http.post<LoginResponse>('/api/user/login', params)
+    return http.post<LoginResponse>('/api/user/login', params, {
+      invalidate: ['/api/user/info']
+    })
   },
 
   /**
    * 获取当前用户信息
    */
   getCurrentUser() {
-    return http.get<UserInfo>('/api/user/info')
+    return http.get<UserInfo>('/api/user/info', {
+      cache: { ttl: 60 * 1000, staleWhileRevalidate: 5 * 60 * 1000 }
+    })
   },
 
   /**
    * 登出
    */
   logout() {
-    return http.post('/api/user/logout')
+    return http.post('/api/user/logout', undefined, {
+      invalidate: ['/api/user/info']
+    })
   }
 }
@@ -0,0 +1,96 @@
+/**
+ * 导出 Web Worker
+ * 在后台线程中将分块传入的数据写入 Excel（exceljs）或 CSV，避免阻塞界面
+ *
+ * 消息协议：
+ * - start  { format, sheetName, headers }  初始化工作簿
+ * - rows   { rows }                       追加一块数据，处理完成后回复 ack
+ * - finish                                生成文件，回复 done { blob }
+ * 出错时回复 error { message }
+ */
+import ExcelJS from 'exceljs'
+
+type ExportFormat = 'xlsx' | 'csv'
+
+type WorkerMessage =
+  | { type: 'start'; format: ExportFormat; sheetName: string; headers: string[] }
+  | { type: 'rows'; rows: any[][] }
+  | { type: 'finish' }
+
+const ctx = self as unknown as Worker
+
+let format: ExportFormat = 'xlsx'
+let workbook: ExcelJS.Workbook | null = null
+let worksheet: ExcelJS.Worksheet | null = null
+// CSV 按块保存为 Blob，避免拼接成一个大字符串
+let csvParts: Blob[] = []
+
+/**
+ * 转义 CSV 单元格
+ */
+function toCsvCell(value: any): string {
+  if (value === null || value === undefined) return ''
+  const text = String(value)
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text
+}
+
+function toCsvLines(rows: any[][]): string {
+  return rows.map((row) => row.map(toCsvCell).join(',')).join('\r\n') + '\r\n'
+}
+
+function start(message: Extract<WorkerMessage, { type: 'start' }>) {
+  format = message.format
+  if (format === 'csv') {
+    // 添加 BOM，保证 Excel 打开中文不乱码
+    csvParts = [new Blob(['\ufeff' + toCsvLines([message.headers])])]
+    return
+  }
+
+  workbook = new ExcelJS.Workbook()
+  worksheet = workbook.addWorksheet(message.sheetName)
+  worksheet.addRow(message.headers).font = { bold: true }
+}
+
+function appendRows(rows: any[][]) {
+  if (format === 'csv') {
+    csvParts.push(new Blob([toCsvLines(rows)]))
+    return
+  }
+  worksheet?.addRows(rows)
+}
+
+async function finish(): Promise<Blob> {
+  if (format === 'csv') {
+    const blob = new Blob(csvParts, { type: 'text/csv;charset=utf-8' })
+    csvParts = []
+    return blob
+  }
+
+  const buffer = await workbook!.xlsx.writeBuffer()
+  workbook = null
+  worksheet = null
+  return new Blob([buffer], {
+    type: 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+  })
+}
+
+ctx.onmessage = async (event: MessageEvent<WorkerMessage>) => {
+  const message = event.data
+  try {
+    switch (message.type) {
+      case 'start':
+        start(message)
+        ctx.postMessage({ type: 'ack' })
+        break
+      case 'rows':
+        appendRows(message.rows)
+        ctx.postMessage({ type: 'ack' })
+        break
+      case 'finish':
+        ctx.postMessage({ type: 'done', blob: await finish() })
+        break
+    }
+  } catch (error: any) {
+    ctx.postMessage({ type: 'error', message: error?.message || '导出失败' })
+  }
+}
@@ -0,0 +1,152 @@
+/**
+ * Crud 数据导出
+ * 主线程按页拉取全部匹配数据，逐块交给 Web Worker 写入文件；
+ * 每块处理完成后才拉取下一块，主线程同一时间只持有一块数据
+ */
+
+export type ExportFormat = 'xlsx' | 'csv'
+
+/**
+ * 导出列
+ */
+export interface ExportColumn {
+  field: string
+  title: string
+  /** 导出值格式化，默认导出原始字段值 */
+  formatter?: (row: any) => any
+}
+
+/**
+ * 导出配置
+ */
+export interface ExportOptions {
+  /** 文件名（不含扩展名时自动补全） */
+  filename: string
+  /** 文件格式，默认 xlsx */
+  format?: ExportFormat
+  /** 工作表名称 */
+  sheetName?: string
+  /** 导出列 */
+  columns: ExportColumn[]
+  /** 按页获取数据 */
+  fetchPage: (page: number, size: number) => Promise<{ items: any[]; count: number }>
+  /** 每块行数，默认 1000 */
+  chunkSize?: number
+  /** 进度回调 */
+  onProgress?: (loaded: number, total: number) => void
+  /** 取消信号 */
+  signal?: AbortSignal
+}
+
+/**
+ * Crud 组件 exportData 的配置（列与数据源由 Crud 提供）
+ */
+export type CrudExportOptions = Omit<ExportOptions, 'columns' | 'fetchPage'>
+
+/**
+ * 导出全部数据并下载
+ * @returns 是否完成（被取消时返回 false）
+ */
+export async function exportRows(options: ExportOptions): Promise<boolean> {
+  const {
+    format = 'xlsx',
+    sheetName = 'Sheet1',
+    columns,
+    fetchPage,
+    chunkSize = 1000,
+    onProgress,
+    signal
+  } = options
+
+  if (signal?.aborted) return false
+
+  const worker = new Worker(new URL('./exportWorker.ts', import.meta.url), { type: 'module' })
+
+  // 等待 Worker 的下一条回复
+  let pendingReply: { resolve: (data: any) => void; reject: (error: Error) => void } | null = null
+  worker.onmessage = (event: MessageEvent) => {
+    const reply = pendingReply
+    pendingReply = null
+    if (event.data?.type === 'error') {
+      reply?.reject(new Error(event.data.message))
+    } else {
+      reply?.resolve(event.data)
+    }
+  }
+  worker.onerror = (event) => {
+    const reply = pendingReply
+    pendingReply = null
+    reply?.reject(new Error(event.message || '导出失败'))
+  }
+
+  const post = (message: any) =>
+    new Promise<any>((resolve, reject) => {
+      pendingReply = { resolve, reject }
+      worker.postMessage(message)
+    })
+
+  // 取消时立即终止 Worker
+  const onAbort = () => {
+    worker.terminate()
+    pendingReply?.resolve(null)
+    pendingReply = null
+  }
+  signal?.addEventListener('abort', onAbort)
+
+  try {
+    await post({ type: 'start', format, sheetName, headers: columns.map((c) => c.title) })
+
+    let page = 1
+    let loaded = 0
+    let total = Infinity
+    while (loaded < total) {
+      if (signal?.aborted) return false
+
+      const result = await fetchPage(page, chunkSize)
+      total = result.count || 0
+      const items = result.items || []
+      if (items.length === 0) break
+
+      const rows = items.map((row) =>
+        columns.map((column) => (column.formatter ? column.formatter(row) : row[column.field]))
+      )
+      loaded += items.length
+
+      if (signal?.aborted) return false
+      await post({ type: 'rows', rows })
+      onProgress?.(loaded, total)
+      page++
+    }
+
+    if (signal?.aborted) return false
+    const reply = await post({ type: 'finish' })
+    if (!reply?.blob) return false
+
+    download(reply.blob, withExtension(options.filename, format))
+    return true
+  } finally {
+    signal?.removeEventListener('abort', onAbort)
+    worker.terminate()
+  }
+}
+
+/**
+ * 补全文件扩展名
+ */
+function withExtension(filename: string, format: ExportFormat): string {
+  return filename.toLowerCase().endsWith(`.${format}`) ? filename : `${filename}.${format}`
+}
+
+/**
+ * 触发浏览器下载
+ */
+function download(blob: Blob, filename: string) {
+  const url = URL.createObjectURL(blob)
+  const link = document.createElement('a')
+  link.href = url
+  link.download = filename
+  document.body.appendChild(link)
+  link.click()
+  document.body.removeChild(link)
+  setTimeout(() => URL.revokeObjectURL(url), 0)
+}
@@ -10,6 +10,11 @@ export type {
   GridColumn,
   ActionItem,
   ToolbarAction,
-  GridOptions
+  GridOptions,
+  SortParams,
+  VirtualConfig
 } from './types'
+export type { CrudExportOptions, ExportFormat } from './exporter'
 
+export { LocalDataSource, createLocalDataSource, useQueryCancelKey } from './localDataSource'
+export type { LocalDataSourceOptions } from './localDataSource'
@@ -0,0 +1,204 @@
+/**
+ * 本地数据源
+ * 将整份数据交给 Web Worker 中的查询引擎建立索引，
+ * 提供与 proxyConfig.ajax.query 相同签名的 query 方法，可直接接入 Crud
+ */
+import { useId } from 'vue'
+import { QueryEngine, parseTime } from './queryEngine'
+import type { EngineQuery, EngineResult, QuerySchema } from './queryEngine'
+import type { SortParams } from './types'
+
+/**
+ * 本地数据源配置
+ */
+export interface LocalDataSourceOptions<T> {
+  /** 数据 */
+  rows: T[]
+  /** 全文搜索字段 */
+  searchFields?: string[]
+  /** 枚举字段：表单中同名字段有值时按等值过滤 */
+  enumFields?: string[]
+  /** 时间区间过滤：表单字段名 -> 数据时间字段名 */
+  timeRanges?: Record<string, string>
+  /** 可排序字段 */
+  sortFields?: string[]
+  /** 表单中搜索文本的字段名，默认 search */
+  searchKey?: string
+}
+
+type Pending = {
+  /** 取消键，为空的查询不会被取消 */
+  cancelKey: string
+  /** 查询条件与排序 */
+  key: string
+  resolve: (result: EngineResult<any>) => void
+  reject: (error: Error) => void
+}
+
+function createCanceledError(): Error {
+  const error = new Error('查询已取消')
+  error.name = 'CanceledError'
+  return error
+}
+
+export class LocalDataSource<T extends Record<string, any> = Record<string, any>> {
+  private options: LocalDataSourceOptions<T>
+  private schema: QuerySchema
+  private worker: Worker | null = null
+  /** 无法使用 Worker 时在主线程运行的引擎 */
+  private engine: QueryEngine<T> | null = null
+  private ready: Promise<void> = Promise.resolve()
+  private pending = new Map<number, Pending>()
+  private seq = 0
+
+  constructor(options: LocalDataSourceOptions<T>) {
+    this.options = options
+    const timeFields = Object.values(options.timeRanges || {})
+    this.schema = {
+      searchFields: options.searchFields || [],
+      enumFields: options.enumFields || [],
+      timeFields,
+      sortFields: options.sortFields || []
+    }
+
+    if (typeof Worker !== 'undefined') {
+      this.worker = new Worker(new URL('./queryWorker.ts', import.meta.url), { type: 'module' })
+      this.worker.onmessage = (event: MessageEvent) => this.handleMessage(event.data)
+    } else {
+      this.engine = new QueryEngine<T>()
+    }
+    this.setRows(options.rows)
+  }
+
+  /**
+   * 替换数据并重建索引
+   */
+  setRows(rows: T[]): Promise<void> {
+    if (this.engine) {
+      this.engine.load(rows, this.schema)
+      return this.ready
+    }
+
+    const id = ++this.seq
+    this.ready = new Promise<void>((resolve, reject) => {
+      this.pending.set(id, { cancelKey: '', key: '', resolve: () => resolve(), reject })
+    })
+    this.worker!.postMessage({ type: 'load', id, rows, schema: this.schema })
+    return this.ready
+  }
+
+  /**
+   * Crud 查询函数（签名与 proxyConfig.ajax.query 一致）
+   * @description 带 cancelKey 的查询会取消同一 cancelKey 下条件或排序不同的旧查询，
+   *              条件相同的查询（如虚拟滚动的不同窗口）与不带 cancelKey 的查询（如导出）不会被取消
+   */
+  query = async (
+    params: { page: any; sort?: SortParams; cancelKey?: string },
+    formValues: any
+  ): Promise<{ items: T[]; count: number }> => {
+    const { currentPage = 1, pageSize = 10 } = params.page || {}
+    const query = this.buildQuery(formValues || {}, params.sort)
+    query.offset = (currentPage - 1) * pageSize
+    query.limit = pageSize
+
+    await this.ready
+    const result = await this.run(query, params.cancelKey || '')
+    return { items: result.items, count: result.total }
+  }
+
+  /**
+   * 释放 Worker
+   */
+  dispose() {
+    this.worker?.terminate()
+    this.worker = null
+    this.pending.forEach((p) => p.reject(createCanceledError()))
+    this.pending.clear()
+  }
+
+  /**
+   * 将表单值转换为引擎查询条件
+   */
+  private buildQuery(formValues: Record<string, any>, sort?: SortParams): EngineQuery {
+    const equals: Record<string, string> = {}
+    for (const field of this.schema.enumFields) {
+      const value = formValues[field]
+      if (value !== undefined && value !== null && value !== '') {
+        equals[field] = String(value)
+      }
+    }
+
+    const ranges: Record<string, [number, number]> = {}
+    for (const [formKey, field] of Object.entries(this.options.timeRanges || {})) {
+      const range = formValues[formKey]
+      if (Array.isArray(range) && range.length === 2) {
+        ranges[field] = [parseTime(range[0]), parseTime(range[1])]
+      }
+    }
+
+    return {
+      search: formValues[this.options.searchKey || 'search'] || '',
+      equals,
+      ranges,
+      sort: sort && this.schema.sortFields.includes(sort.field) ? sort : undefined,
+      offset: 0,
+      limit: 0
+    }
+  }
+
+  /**
+   * 执行查询，取消同一 cancelKey 下条件不同的进行中查询
+   */
+  private run(query: EngineQuery, cancelKey: string): Promise<EngineResult<T>> {
+    if (this.engine) {
+      return Promise.resolve(this.engine.query(query))
+    }
+
+    const key = JSON.stringify([query.search, query.equals, query.ranges, query.sort])
+    const cancel: number[] = []
+    this.pending.forEach((p, id) => {
+      if (cancelKey && p.cancelKey === cancelKey && p.key !== key) {
+        cancel.push(id)
+        p.reject(createCanceledError())
+      }
+    })
+    cancel.forEach((id) => this.pending.delete(id))
+
+    const id = ++this.seq
+    return new Promise<EngineResult<T>>((resolve, reject) => {
+      this.pending.set(id, { cancelKey, key, resolve, reject })
+      this.worker!.postMessage({ type: 'query', id, query, cancel })
+    })
+  }
+
+  private handleMessage(data: any) {
+    const pending = this.pending.get(data.id)
+    if (!pending) return
+    this.pending.delete(data.id)
+
+    if (data.type === 'error') {
+      pending.reject(new Error(data.message))
+    } else {
+      pending.resolve({ items: data.items, total: data.total })
+    }
+  }
+}
+
+/**
+ * 创建本地数据源
+ */
+export function createLocalDataSource<T extends Record<string, any>>(
+  options: LocalDataSourceOptions<T>
+): LocalDataSource<T> {
+  return new LocalDataSource<T>(options)
+}
+
+/**
+ * 生成当前组件实例专属的查询取消键（需在 setup 中调用）
+ * @description 同一取消键下，条件不同的新查询会取消旧查询。每个组件实例使用独立的键，
+ *              多个表格共用同一数据源或接口时互不影响；导出与虚拟滚动窗口的查询不带取消键，不会被取消
+ * @param scope - 键前缀，如接口地址
+ */
+export function useQueryCancelKey(scope = ''): string {
+  return `crud:${scope}:${useId()}`
+}
@@ -0,0 +1,395 @@
+/**
+ * 本地查询引擎
+ * 加载时一次性建立索引，查询时只做索引求交与分页：
+ * - 枚举列：倒排索引（值 -> 升序行号列表）
+ * - 时间列：预解析为毫秒时间戳（Float64Array）
+ * - 搜索列：三元组（trigram）索引，命中后再做一次 includes 校验
+ * - 排序列：预排序的行号排列（perm）及其逆排列（rank）
+ * 引擎本身不依赖 DOM，可在 Web Worker 或主线程中运行
+ */
+import type { SortParams } from './types'
+
+/**
+ * 索引定义
+ */
+export interface QuerySchema {
+  /** 全文搜索字段 */
+  searchFields: string[]
+  /** 枚举字段（等值过滤） */
+  enumFields: string[]
+  /** 时间字段（区间过滤，值为 YYYY-MM-DD HH:mm:ss 字符串） */
+  timeFields: string[]
+  /** 可排序字段 */
+  sortFields: string[]
+}
+
+/**
+ * 查询条件
+ */
+export interface EngineQuery {
+  /** 搜索文本 */
+  search?: string
+  /** 枚举字段等值条件 */
+  equals?: Record<string, string>
+  /** 时间字段区间条件（毫秒时间戳，开区间） */
+  ranges?: Record<string, [number, number]>
+  /** 排序 */
+  sort?: SortParams
+  /** 起始行 */
+  offset: number
+  /** 行数 */
+  limit: number
+}
+
+export interface EngineResult<T> {
+  items: T[]
+  total: number
+}
+
+const EMPTY = new Uint32Array(0)
+const TIME_PATTERN = /^(\d{4})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?/
+
+/**
+ * 解析 YYYY-MM-DD HH:mm:ss 为本地时间戳，无法解析时返回 NaN
+ */
+export function parseTime(value: unknown): number {
+  if (typeof value === 'number') return value
+  if (typeof value !== 'string') return NaN
+  const match = TIME_PATTERN.exec(value)
+  if (!match) return NaN
+  return new Date(
+    Number(match[1]),
+    Number(match[2]) - 1,
+    Number(match[3]),
+    Number(match[4] || 0),
+    Number(match[5] || 0),
+    Number(match[6] || 0)
+  ).getTime()
+}
+
+/**
+ * 提取文本中的所有三元组（去重）
+ */
+function trigrams(text: string): Set<string> {
+  const result = new Set<string>()
+  for (let i = 0; i + 3 <= text.length; i++) {
+    result.add(text.slice(i, i + 3))
+  }
+  return result
+}
+
+/**
+ * 在升序列表中查找第一个不小于 value 的位置
+ */
+function lowerBound(list: Uint32Array, value: number, from: number): number {
+  let lo = from
+  let hi = list.length
+  while (lo < hi) {
+    const mid = (lo + hi) >>> 1
+    if (list[mid]! < value) lo = mid + 1
+    else hi = mid
+  }
+  return lo
+}
+
+/**
+ * 两个升序行号列表求交（a 为较短列表）
+ */
+function intersect(a: Uint32Array, b: Uint32Array): Uint32Array {
+  const out = new Uint32Array(Math.min(a.length, b.length))
+  let i = 0
+  let j = 0
+  let k = 0
+
+  // 长度悬殊时对长列表二分查找
+  if (a.length * 16 < b.length) {
+    for (; i < a.length && j < b.length; i++) {
+      const x = a[i]!
+      j = lowerBound(b, x, j)
+      if (b[j] === x) out[k++] = x
+    }
+    return out.subarray(0, k)
+  }
+
+  while (i < a.length && j < b.length) {
+    const x = a[i]!
+    const y = b[j]!
+    if (x === y) {
+      out[k++] = x
+      i++
+      j++
+    } else if (x < y) {
+      i++
+    } else {
+      j++
+    }
+  }
+  return out.subarray(0, k)
+}
+
+/** 候选行少于该值时停止求交，剩余条件由逐行校验完成 */
+const VERIFY_THRESHOLD = 256
+
+/**
+ * 多个升序行号列表求交（从最短的开始）
+ * @param exact - 精确求交的列表
+ * @param loose - 可提前停止求交的列表（之后会逐行校验）
+ */
+function intersectAll(exact: Uint32Array[], loose: Uint32Array[]): Uint32Array | null {
+  const sortedExact = [...exact].sort((a, b) => a.length - b.length)
+  const sortedLoose = [...loose].sort((a, b) => a.length - b.length)
+  let result: Uint32Array | null = null
+  for (const list of sortedExact) {
+    result = result ? intersect(result, list) : list
+    if (result.length === 0) return result
+  }
+  for (const list of sortedLoose) {
+    if (result && result.length < VERIFY_THRESHOLD) break
+    result = result ? intersect(result, list) : list
+    if (result.length === 0) return result
+  }
+  return result
+}
+
+// 数字感知的字符串比较（'2' 排在 '10' 之前）
+const collator = new Intl.Collator(undefined, { numeric: true })
+
+function compareValues(a: any, b: any): number {
+  if (a === b) return 0
+  if (a === undefined || a === null) return -1
+  if (b === undefined || b === null) return 1
+  if (typeof a === 'number' && typeof b === 'number') return a - b
+  return collator.compare(String(a), String(b))
+}
+
+export class QueryEngine<T extends Record<string, any> = Record<string, any>> {
+  private rows: T[] = []
+  private enumIndex = new Map<string, Map<string, Uint32Array>>()
+  private timeColumns = new Map<string, Float64Array>()
+  private sortIndex = new Map<string, { perm: Uint32Array; rank: Uint32Array }>()
+  private searchTexts: string[] = []
+  private trigramIndex = new Map<string, Uint32Array>()
+  /** 复用的匹配结果缓冲区 */
+  private matchBuffer = EMPTY
+  /** 复用的标记数组（排序时按排列顺序筛选） */
+  private mask = new Uint8Array(0)
+
+  /**
+   * 加载数据并建立索引
+   */
+  load(rows: T[], schema: QuerySchema) {
+    const n = rows.length
+    this.rows = rows
+    this.matchBuffer = new Uint32Array(n)
+    this.mask = new Uint8Array(n)
+
+    // 时间列
+    this.timeColumns.clear()
+    for (const field of schema.timeFields) {
+      const column = new Float64Array(n)
+      for (let i = 0; i < n; i++) {
+        // 无法解析的时间视为最早，区间过滤时不会命中
+        const time = parseTime(rows[i]![field])
+        column[i] = Number.isNaN(time) ? -Infinity : time
+      }
+      this.timeColumns.set(field, column)
+    }
+
+    // 枚举倒排索引
+    this.enumIndex.clear()
+    for (const field of schema.enumFields) {
+      const postings = new Map<string, number[]>()
+      for (let i = 0; i < n; i++) {
+        const value = String(rows[i]![field] ?? '')
+        let list = postings.get(value)
+        if (!list) {
+          list = []
+          postings.set(value, list)
+        }
+        list.push(i)
+      }
+      const index = new Map<string, Uint32Array>()
+      postings.forEach((list, value) => index.set(value, Uint32Array.from(list)))
+      this.enumIndex.set(field, index)
+    }
+
+    // 搜索文本与三元组索引
+    this.searchTexts = new Array(n)
+    const grams = new Map<string, number[]>()
+    for (let i = 0; i < n; i++) {
+      const text = schema.searchFields
+        .map((field) => String(rows[i]![field] ?? '').toLowerCase())
+        .join('\u0001')
+      this.searchTexts[i] = text
+      trigrams(text).forEach((gram) => {
+        let list = grams.get(gram)
+        if (!list) {
+          list = []
+          grams.set(gram, list)
+        }
+        list.push(i)
+      })
+    }
+    this.trigramIndex.clear()
+    grams.forEach((list, gram) => this.trigramIndex.set(gram, Uint32Array.from(list)))
+
+    // 排序索引（时间字段同时用于区间查找）
+    this.sortIndex.clear()
+    for (const field of new Set([...schema.sortFields, ...schema.timeFields])) {
+      const time = this.timeColumns.get(field)
+      const perm = new Uint32Array(n)
+      for (let i = 0; i < n; i++) perm[i] = i
+      perm.sort(
+        time
+          ? (a, b) => (time[a]! < time[b]! ? -1 : time[a]! > time[b]! ? 1 : a - b)
+          : (a, b) => compareValues(rows[a]![field], rows[b]![field]) || a - b
+      )
+      const rank = new Uint32Array(n)
+      for (let i = 0; i < n; i++) rank[perm[i]!] = i
+      this.sortIndex.set(field, { perm, rank })
+    }
+  }
+
+  /**
+   * 执行查询
+   */
+  query(query: EngineQuery): EngineResult<T> {
+    const n = this.rows.length
+    const search = (query.search || '').trim().toLowerCase()
+    const ranges = Object.entries(query.ranges || {})
+      .map(([field, range]) => ({ column: this.timeColumns.get(field), range }))
+      .filter((r): r is { column: Float64Array; range: [number, number] } => !!r.column)
+
+    // 1. 通过索引求出候选行（null 表示全部行）
+    const exact: Uint32Array[] = []
+    const loose: Uint32Array[] = []
+    for (const [field, value] of Object.entries(query.equals || {})) {
+      const index = this.enumIndex.get(field)
+      if (index) exact.push(index.get(String(value)) || EMPTY)
+    }
+    for (const [field, range] of Object.entries(query.ranges || {})) {
+      const ids = this.rangeIds(field, range)
+      if (ids) loose.push(ids)
+    }
+    if (search.length >= 3) {
+      for (const gram of trigrams(search)) {
+        loose.push(this.trigramIndex.get(gram) || EMPTY)
+      }
+    }
+    const candidates = intersectAll(exact, loose)
+
+    // 2. 逐行校验区间与搜索文本
+    let matches: Uint32Array | null = candidates
+    if (search || ranges.length > 0) {
+      const buffer = this.matchBuffer
+      let count = 0
+      const total = candidates ? candidates.length : n
+      for (let i = 0; i < total; i++) {
+        const id = candidates ? candidates[i]! : i
+        if (search && !this.searchTexts[id]!.includes(search)) continue
+        let inRange = true
+        for (const { column, range } of ranges) {
+          const time = column[id]!
+          if (!(time > range[0] && time < range[1])) {
+            inRange = false
+            break
+          }
+        }
+        if (inRange) buffer[count++] = id
+      }
+      matches = buffer.subarray(0, count)
+    }
+
+    const total = matches ? matches.length : n
+    const ids = this.page(matches, total, query)
+    const items = new Array<T>(ids.length)
+    for (let i = 0; i < ids.length; i++) items[i] = this.rows[ids[i]!]!
+    return { items, total }
+  }
+
+  /**
+   * 通过时间字段的排序索引二分查找区间内的行号（返回升序行号）
+   */
+  private rangeIds(field: string, range: [number, number]): Uint32Array | null {
+    const column = this.timeColumns.get(field)
+    const index = this.sortIndex.get(field)
+    if (!column || !index) return null
+
+    const { perm } = index
+    const bound = (value: number, inclusive: boolean) => {
+      let lo = 0
+      let hi = perm.length
+      while (lo < hi) {
+        const mid = (lo + hi) >>> 1
+        const time = column[perm[mid]!]!
+        if (time < value || (inclusive && time === value)) lo = mid + 1
+        else hi = mid
+      }
+      return lo
+    }
+    // 开区间 (start, end)
+    const from = bound(range[0], true)
+    const to = bound(range[1], false)
+    return from < to ? perm.slice(from, to).sort() : EMPTY
+  }
+
+  /**
+   * 排序并取出当前页的行号
+   */
+  private page(matches: Uint32Array | null, total: number, query: EngineQuery): Uint32Array {
+    const start = Math.max(0, query.offset)
+    const end = Math.min(total, start + Math.max(0, query.limit))
+    if (start >= end) return EMPTY
+
+    const index = query.sort ? this.sortIndex.get(query.sort.field) : undefined
+    const desc = query.sort?.order === 'desc'
+
+    if (!index) {
+      // 无排序：保持原始顺序
+      if (!matches) {
+        const ids = new Uint32Array(end - start)
+        for (let i = 0; i < ids.length; i++) ids[i] = start + i
+        return ids
+      }
+      return matches.slice(start, end)
+    }
+
+    const { perm, rank } = index
+    const n = perm.length
+    const ids = new Uint32Array(end - start)
+
+    if (!matches) {
+      // 全部行：直接读取预排序的排列
+      for (let i = start; i < end; i++) {
+        ids[i - start] = perm[desc ? n - 1 - i : i]!
+      }
+      return ids
+    }
+
+    const k = matches.length
+    if (k * Math.log2(k + 1) < n) {
+      // 匹配行较少：对其名次做数值排序
+      const ranks = new Uint32Array(k)
+      for (let i = 0; i < k; i++) ranks[i] = rank[matches[i]!]!
+      ranks.sort()
+      for (let i = start; i < end; i++) {
+        ids[i - start] = perm[ranks[desc ? k - 1 - i : i]!]!
+      }
+      return ids
+    }
+
+    // 匹配行较多：标记后按排列顺序扫描，取够当前页即停止
+    const mask = this.mask
+    for (let i = 0; i < k; i++) mask[matches[i]!] = 1
+    let seen = 0
+    for (let p = 0; p < n && seen < end; p++) {
+      const id = perm[desc ? n - 1 - p : p]!
+      if (mask[id]) {
+        if (seen >= start) ids[seen - start] = id
+        seen++
+      }
+    }
+    for (let i = 0; i < k; i++) mask[matches[i]!] = 0
+    return ids
+  }
+}
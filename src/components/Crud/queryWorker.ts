@@ -0,0 +1,54 @@
+/**
+ * 本地查询 Web Worker
+ *
+ * 消息协议：
+ * - load   { id, rows, schema }   加载数据并建立索引，回复 loaded
+ * - query  { id, query, cancel }  执行查询，回复 result { items, total }；
+ *                                 cancel 中列出的排队查询会被丢弃
+ */
+import { QueryEngine } from './queryEngine'
+import type { EngineQuery, QuerySchema } from './queryEngine'
+
+type WorkerMessage =
+  | { type: 'load'; id: number; rows: any[]; schema: QuerySchema }
+  | { type: 'query'; id: number; query: EngineQuery; cancel?: number[] }
+
+const ctx = self as unknown as Worker
+const engine = new QueryEngine()
+
+// 排队中的查询：在同一轮消息处理完后统一执行，使后到的取消请求能跳过过期查询
+const queue = new Map<number, EngineQuery>()
+let scheduled = false
+
+function drain() {
+  scheduled = false
+  queue.forEach((query, id) => {
+    queue.delete(id)
+    try {
+      ctx.postMessage({ type: 'result', id, ...engine.query(query) })
+    } catch (error: any) {
+      ctx.postMessage({ type: 'error', id, message: error?.message || '查询失败' })
+    }
+  })
+}
+
+ctx.onmessage = (event: MessageEvent<WorkerMessage>) => {
+  const message = event.data
+
+  if (message.type === 'load') {
+    try {
+      engine.load(message.rows, message.schema)
+      ctx.postMessage({ type: 'loaded', id: message.id })
+    } catch (error: any) {
+      ctx.postMessage({ type: 'error', id: message.id, message: error?.message || '加载失败' })
+    }
+    return
+  }
+
+  message.cancel?.forEach((id) => queue.delete(id))
+  queue.set(message.id, message.query)
+  if (!scheduled) {
+    scheduled = true
+    setTimeout(drain, 0)
+  }
+}
@@ -3,6 +3,8 @@
  * 基于配置驱动的 CRUD 组件系统
  */
 
+import type { RequestCachePolicy } from '@/api/http'
+
 /**
  * 页面配置
  */
@@ -15,6 +17,12 @@ export interface PageConfig {
   enablePagination?: boolean
   /** 启用行选择 */
   enableSelection?: boolean
+  /**
+   * 滚动模式
+   * - pagination: 分页模式（默认）
+   * - virtual: 虚拟滚动模式，按窗口加载数据，无需翻页
+   */
+  scrollMode?: 'pagination' | 'virtual'
 }
 
 /**
@@ -74,6 +82,10 @@ export interface GridColumn {
   }
   /** 操作按钮配置 */
   actions?: ActionItem[]
+  /** 单元格格式化 */
+  formatter?: (params: { cellValue: any; row: any }) => any
+  /** 导出值格式化，未设置时使用 formatter，都未设置时导出原始字段值 */
+  exportFormatter?: (row: any) => any
 }
 
 /**
@@ -112,6 +124,8 @@ export interface ActionItem {
   }
   /** 点击事件 */
   onClick?: (row: any) => void
+  /** 所需权限码（多个时拥有任一即可），无权限时不显示 */
+  permission?: string | string[]
 }
 
 /**
@@ -126,6 +140,32 @@ export interface ToolbarAction {
   componentProps?: Record<string, any>
   /** 点击事件 */
   onClick?: () => void
+  /** 所需权限码（多个时拥有任一即可），无权限时不显示 */
+  permission?: string | string[]
+}
+
+/**
+ * 排序参数
+ */
+export interface SortParams {
+  field: string
+  order: 'asc' | 'desc'
+}
+
+/**
+ * 虚拟滚动配置
+ */
+export interface VirtualConfig {
+  /** 每个数据窗口的行数（即每次请求的 pageSize），默认 100 */
+  windowSize?: number
+  /** 可视区域前后各预取的窗口数，默认 1 */
+  prefetch?: number
+  /** 最多缓存的窗口数，默认 10 */
+  maxWindows?: number
+  /** 行高（像素），默认 48 */
+  rowHeight?: number
+  /** 表格高度（像素），默认 560 */
+  height?: number
 }
 
 /**
@@ -137,7 +177,10 @@ export interface GridOptions {
   /** 数据源配置 */
   proxyConfig?: {
     ajax: {
-      query: (params: { page: any }, formValues: any) => Promise<{ items: any[]; count: number }>
+      query: (
+        params: { page: any; sort?: SortParams; cancelKey?: string },
+        formValues: any
+      ) => Promise<{ items: any[]; count: number }>
     }
   }
   /** 是否自适应列宽 */
@@ -153,6 +196,8 @@ export interface GridOptions {
     remote: boolean
     defaultSort?: { field: string; order: 'asc' | 'desc' }
   }
+  /** 虚拟滚动配置（pageConfig.scrollMode 为 virtual 时生效） */
+  virtualConfig?: VirtualConfig
 }
 
 /**
@@ -165,6 +210,8 @@ export interface LocalCrudConfig {
   pageConfig?: PageConfig
   /** API 端点（列表接口） */
   api?: string
+  /** 列表接口缓存策略（默认不缓存，编辑提交后自动失效） */
+  apiCache?: boolean | RequestCachePolicy
   /** 其他选项 */
   options: {
     /** 表单配置 */
@@ -0,0 +1,142 @@
+/**
+ * 虚拟滚动数据窗口缓存
+ * 按固定大小的窗口（即分页）加载数据，只保留有限数量的窗口，
+ * 使内存占用与数据总量无关
+ */
+
+/**
+ * 窗口加载函数
+ * @param windowIndex - 窗口序号（从 0 开始）
+ * @param windowSize - 窗口行数
+ */
+export type WindowFetcher<T> = (
+  windowIndex: number,
+  windowSize: number
+) => Promise<{ items: T[]; count: number }>
+
+export interface WindowCacheOptions {
+  /** 每个窗口的行数 */
+  windowSize: number
+  /** 最多缓存的窗口数 */
+  maxWindows: number
+  /** 可视区域前后各预取的窗口数 */
+  prefetch: number
+  /** 窗口加载完成回调 */
+  onLoad?: () => void
+  /** 窗口加载失败回调 */
+  onError?: (error: unknown) => void
+}
+
+export class WindowCache<T = any> {
+  /** 已加载的窗口（Map 插入顺序即 LRU 顺序） */
+  private windows = new Map<number, T[]>()
+  /** 加载中的窗口 */
+  private pending = new Map<number, Promise<void>>()
+  /** 重置代次：重置后旧请求的结果被丢弃 */
+  private generation = 0
+  /** 当前需要保留的窗口（可视区域及预取范围） */
+  private pinned = new Set<number>()
+
+  private fetcher: WindowFetcher<T>
+  private options: WindowCacheOptions
+
+  /** 数据总行数（以最近一次响应为准） */
+  total = 0
+
+  constructor(fetcher: WindowFetcher<T>, options: WindowCacheOptions) {
+    this.fetcher = fetcher
+    this.options = options
+  }
+
+  /**
+   * 获取指定行，未加载时返回 undefined
+   */
+  getRow(index: number): T | undefined {
+    const { windowSize } = this.options
+    return this.windows.get(Math.floor(index / windowSize))?.[index % windowSize]
+  }
+
+  /**
+   * 确保 [start, end) 范围内的行已加载，并预取相邻窗口
+   */
+  ensureRange(start: number, end: number): Promise<void> {
+    const { windowSize, prefetch } = this.options
+    const first = Math.max(0, Math.floor(start / windowSize) - prefetch)
+    let last = Math.floor(Math.max(start, end - 1) / windowSize) + prefetch
+    if (this.total > 0) {
+      last = Math.min(last, Math.ceil(this.total / windowSize) - 1)
+    }
+
+    this.pinned = new Set()
+    const tasks: Promise<void>[] = []
+    for (let i = first; i <= last; i++) {
+      this.pinned.add(i)
+      const cached = this.windows.get(i)
+      if (cached) {
+        // 刷新 LRU 顺序
+        this.windows.delete(i)
+        this.windows.set(i, cached)
+      } else {
+        tasks.push(this.load(i))
+      }
+    }
+
+    this.evict()
+    return Promise.all(tasks).then(() => undefined)
+  }
+
+  /**
+   * 清空缓存（搜索条件或排序变化时调用）
+   */
+  reset() {
+    this.generation++
+    this.windows.clear()
+    this.pending.clear()
+    this.pinned.clear()
+    this.total = 0
+  }
+
+  /**
+   * 加载单个窗口
+   */
+  private load(index: number): Promise<void> {
+    const pending = this.pending.get(index)
+    if (pending) return pending
+
+    const generation = this.generation
+    const task = this.fetcher(index, this.options.windowSize)
+      .then((result) => {
+        if (generation !== this.generation) return
+        this.windows.set(index, result.items || [])
+        this.total = result.count || 0
+        this.evict()
+        this.options.onLoad?.()
+      })
+      .catch((error) => {
+        if (generation === this.generation) {
+          this.options.onError?.(error)
+        }
+      })
+      .finally(() => {
+        if (this.pending.get(index) === task) {
+          this.pending.delete(index)
+        }
+      })
+
+    this.pending.set(index, task)
+    return task
+  }
+
+  /**
+   * 淘汰最久未使用的窗口，可视范围内的窗口不会被淘汰
+   */
+  private evict() {
+    const limit = Math.max(this.options.maxWindows, this.pinned.size)
+    for (const index of this.windows.keys()) {
+      if (this.windows.size <= limit) break
+      if (!this.pinned.has(index)) {
+        this.windows.delete(index)
+      }
+    }
+  }
+}
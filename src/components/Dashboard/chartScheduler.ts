@@ -0,0 +1,119 @@
+/**
+ * @fileoverview 图表调度器
+ * 所有图表共用一个 ResizeObserver 和一个 IntersectionObserver，
+ * 尺寸变化与数据更新合并到同一个动画帧中统一处理
+ */
+
+/**
+ * 被调度的图表
+ */
+export interface ChartHandle {
+  /**
+   * 在动画帧中执行待处理的更新
+   * @param resized - 本帧之前容器尺寸是否发生过变化
+   */
+  flush(resized: boolean): void
+  /**
+   * 可见性变化
+   * @param visible - 是否进入视口（含预加载边距）
+   */
+  setVisible(visible: boolean): void
+}
+
+/** 提前初始化的视口边距，滚动到附近时就开始渲染 */
+const VIEWPORT_MARGIN = '200px'
+
+const handles = new Map<Element, ChartHandle>()
+// 待执行的图表及其是否需要调整尺寸
+const pending = new Map<ChartHandle, boolean>()
+let frame = 0
+
+let resizeObserver: ResizeObserver | null = null
+let intersectionObserver: IntersectionObserver | null = null
+
+function flushFrame() {
+  frame = 0
+  const batch = [...pending]
+  pending.clear()
+  batch.forEach(([handle, resized]) => handle.flush(resized))
+}
+
+/**
+ * 安排图表在下一帧更新（同一帧内多次调用只执行一次）
+ * @param handle - 图表
+ * @param resized - 是否需要调整尺寸
+ */
+export function scheduleChart(handle: ChartHandle, resized = false) {
+  pending.set(handle, pending.get(handle) || resized)
+  if (!frame) {
+    frame = requestAnimationFrame(flushFrame)
+  }
+}
+
+function handleWindowResize() {
+  handles.forEach((handle) => scheduleChart(handle, true))
+}
+
+function ensureObservers() {
+  if (resizeObserver || intersectionObserver) return
+
+  if (typeof ResizeObserver !== 'undefined') {
+    resizeObserver = new ResizeObserver((entries) => {
+      entries.forEach((entry) => {
+        const handle = handles.get(entry.target)
+        if (handle) scheduleChart(handle, true)
+      })
+    })
+  } else {
+    window.addEventListener('resize', handleWindowResize)
+  }
+
+  if (typeof IntersectionObserver !== 'undefined') {
+    intersectionObserver = new IntersectionObserver(
+      (entries) => {
+        entries.forEach((entry) => {
+          handles.get(entry.target)?.setVisible(entry.isIntersecting)
+        })
+      },
+      { rootMargin: VIEWPORT_MARGIN }
+    )
+  }
+}
+
+/**
+ * 开始观察图表容器
+ * @param el - 图表容器
+ * @param handle - 图表
+ */
+export function observeChart(el: Element, handle: ChartHandle) {
+  ensureObservers()
+  handles.set(el, handle)
+  resizeObserver?.observe(el)
+  if (intersectionObserver) {
+    intersectionObserver.observe(el)
+  } else {
+    // 不支持 IntersectionObserver 时视为始终可见
+    handle.setVisible(true)
+  }
+}
+
+/**
+ * 停止观察图表容器
+ * @param el - 图表容器
+ */
+export function unobserveChart(el: Element) {
+  const handle = handles.get(el)
+  if (!handle) return
+  handles.delete(el)
+  pending.delete(handle)
+  resizeObserver?.unobserve(el)
+  intersectionObserver?.unobserve(el)
+
+  if (handles.size === 0) {
+    resizeObserver?.disconnect()
+    intersectionObserver?.disconnect()
+    resizeObserver = null
+    intersectionObserver = null
+    window.removeEventListener('resize', handleWindowResize)
+  }
+}
@@ -0,0 +1,30 @@
+/**
+ * @fileoverview ECharts 按需引入
+ * 只注册项目中用到的图表类型与组件，避免打包完整的 echarts
+ * 新增图表类型时需要在这里注册
+ */
+import * as echarts from 'echarts/core'
+import { LineChart, BarChart, PieChart, GaugeChart } from 'echarts/charts'
+import {
+  GridComponent,
+  TooltipComponent,
+  LegendComponent,
+  TitleComponent
+} from 'echarts/components'
+import { LabelLayout } from 'echarts/features'
+import { CanvasRenderer } from 'echarts/renderers'
+
+echarts.use([
+  LineChart,
+  BarChart,
+  PieChart,
+  GaugeChart,
+  GridComponent,
+  TooltipComponent,
+  LegendComponent,
+  TitleComponent,
+  LabelLayout,
+  CanvasRenderer
+])
+
+export { echarts }
@@ -0,0 +1,122 @@
+/**
+ * @fileoverview 流式数据缓冲区
+ * 固定容量的环形缓冲区，超出容量时丢弃最旧的数据点；
+ * 渲染时使用 LTTB（Largest-Triangle-Three-Buckets）降采样，
+ * 使长时间运行的实时图表内存与单帧计算量保持恒定
+ */
+
+/** 数据点：[x, y]，时间轴使用毫秒时间戳 */
+export type SeriesPoint = [number, number]
+
+export class SeriesBuffer {
+  private xs: Float64Array
+  private ys: Float64Array
+  private start = 0
+  private count = 0
+
+  /**
+   * @param capacity - 最多保留的数据点数
+   */
+  constructor(capacity: number) {
+    this.xs = new Float64Array(capacity)
+    this.ys = new Float64Array(capacity)
+  }
+
+  /** 当前数据点数 */
+  get size(): number {
+    return this.count
+  }
+
+  /** 容量 */
+  get capacity(): number {
+    return this.xs.length
+  }
+
+  /**
+   * 追加数据点，超出容量时覆盖最旧的数据点
+   */
+  push(points: readonly SeriesPoint[]) {
+    const capacity = this.capacity
+    if (capacity === 0) return
+
+    // 只有最后 capacity 个点会被保留
+    const from = Math.max(0, points.length - capacity)
+    for (let i = from; i < points.length; i++) {
+      const point = points[i]!
+      const index = (this.start + this.count) % capacity
+      this.xs[index] = point[0]
+      this.ys[index] = point[1]
+      if (this.count < capacity) {
+        this.count++
+      } else {
+        this.start = (this.start + 1) % capacity
+      }
+    }
+  }
+
+  /**
+   * 清空数据
+   */
+  clear() {
+    this.start = 0
+    this.count = 0
+  }
+
+  /**
+   * 降采样后的数据
+   * @param threshold - 目标点数，小于 3 或不小于现有点数时返回全部数据
+   */
+  sample(threshold: number): SeriesPoint[] {
+    const n = this.count
+    const capacity = this.capacity
+    const x = (i: number) => this.xs[(this.start + i) % capacity]!
+    const y = (i: number) => this.ys[(this.start + i) % capacity]!
+
+    if (threshold < 3 || threshold >= n) {
+      const all: SeriesPoint[] = new Array(n)
+      for (let i = 0; i < n; i++) all[i] = [x(i), y(i)]
+      return all
+    }
+
+    const sampled: SeriesPoint[] = [[x(0), y(0)]]
+    // 除首尾两点外，其余数据平均分到 threshold - 2 个桶中
+    const bucketSize = (n - 2) / (threshold - 2)
+    let a = 0
+
+    for (let i = 0; i < threshold - 2; i++) {
+      // 下一个桶的平均点
+      const nextStart = Math.floor((i + 1) * bucketSize) + 1
+      const nextEnd = Math.min(Math.floor((i + 2) * bucketSize) + 1, n)
+      let avgX = 0
+      let avgY = 0
+      for (let j = nextStart; j < nextEnd; j++) {
+        avgX += x(j)
+        avgY += y(j)
+      }
+      const nextLength = nextEnd - nextStart || 1
+      avgX /= nextLength
+      avgY /= nextLength
+
+      // 当前桶中与上一个选中点、下一个桶平均点构成最大三角形的点
+      const rangeStart = Math.floor(i * bucketSize) + 1
+      const rangeEnd = Math.floor((i + 1) * bucketSize) + 1
+      const ax = x(a)
+      const ay = y(a)
+      let maxArea = -1
+      let selected = rangeStart
+      for (let j = rangeStart; j < rangeEnd; j++) {
+        const area = Math.abs((ax - avgX) * (y(j) - ay) - (ax - x(j)) * (avgY - ay))
+        if (area > maxArea) {
+          maxArea = area
+          selected = j
+        }
+      }
+
+      sampled.push([x(selected), y(selected)])
+      a = selected
+    }
+
+    sampled.push([x(n - 1), y(n - 1)])
+    return sampled
+  }
+}
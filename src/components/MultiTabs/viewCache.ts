@@ -0,0 +1,42 @@
+/**
+ * @fileoverview 标签页页面缓存辅助方法
+ */
+import { defineComponent, markRaw } from 'vue'
+import type { Component } from 'vue'
+
+/** 每个 DOM 节点的估算内存（字节），包含节点本身及其关联的组件状态 */
+const BYTES_PER_NODE = 1024
+
+const wrappers = new Map<string, Component>()
+
+/**
+ * 获取以路由路径命名的包装组件
+ * @description KeepAlive 的 include 按组件名匹配，而同一个页面组件可能被多个路由复用，
+ *              因此为每个路径生成一个同名的包装组件，使缓存以标签页为单位
+ * @param path - 路由路径
+ */
+export function getViewWrapper(path: string): Component {
+  let wrapper = wrappers.get(path)
+  if (!wrapper) {
+    wrapper = markRaw(
+      defineComponent({
+        name: path,
+        setup(_, { slots }) {
+          return () => slots.default?.()
+        }
+      })
+    )
+    wrappers.set(path, wrapper)
+  }
+  return wrapper
+}
+
+/**
+ * 估算页面占用的内存
+ * @param el - 页面所在的容器元素
+ * @returns 估算字节数
+ */
+export function estimateViewSize(el?: Element | null): number {
+  if (!el) return 0
+  return el.getElementsByTagName('*').length * BYTES_PER_NODE
+}
@@ -1,14 +1,12 @@
 import { createApp } from 'vue'
 import { createPinia } from 'pinia'
 import piniaPluginPersistedstate from 'pinia-plugin-persistedstate'
-import Antd from 'ant-design-vue'
-import VxeTable from 'vxe-table'
-import VxeTablePluginExportXlsx from 'vxe-table-plugin-export-xlsx'
 import App from './App.vue'
 import router from './router'
+import { setupAntd } from './plugins/antd'
+import { vPermission } from './permission'
 
 import 'ant-design-vue/dist/reset.css'
-import 'vxe-table/lib/style.css'
 // 引入全局滚动条样式
 import './styles/scrollbar.css'
 
@@ -19,10 +17,37 @@ pinia.use(piniaPluginPersistedstate)
 
 app.use(pinia)
 app.use(router)
-app.use(Antd)
 
-// 注册 VXE-Table（必须在最后）
-VxeTable.use(VxeTablePluginExportXlsx)
-app.use(VxeTable)
+// 权限指令：v-permission="'system:user:edit'"
+app.directive('permission', vPermission)
 
-app.mount('#app')
+// Ant Design Vue 组件由路由守卫按需注册（见 plugins/antd.ts）
+// VXE-Table 由 Crud 组件局部注册，随业务页面分包加载
+setupAntd(app)
+
+/**
+ * 首次导航失败时的提示（此时 UI 组件可能未注册，只使用原生 DOM）
+ */
+function renderBootError() {
+  const container = document.getElementById('app')
+  if (!container) return
+  container.innerHTML = `
+    <div style="padding: 80px 24px; text-align: center; color: rgba(0, 0, 0, 0.65)">
+      <p style="font-size: 16px">页面加载失败，请检查网络后重试</p>
+      <button type="button" style="padding: 4px 15px; cursor: pointer">重新加载</button>
+    </div>
+  `
+  container.querySelector('button')?.addEventListener('click', () => location.reload())
+}
+
+// 等待首次导航（包括组件注册）完成后再挂载，保证首屏组件均已注册；
+// 首次导航失败（如分包加载失败）时显示错误提示，避免白屏
+router.isReady().then(
+  () => {
+    app.mount('#app')
+  },
+  (error) => {
+    console.error('首次导航失败:', error)
+    renderBootError()
+  }
+)
@@ -0,0 +1,78 @@
+import { watch } from 'vue'
+import type { Directive, DirectiveBinding } from 'vue'
+import { useUserStore } from '@/store/modules/user'
+
+export type PermissionValue = string | string[] | null | undefined
+
+type PermissionBinding = DirectiveBinding<PermissionValue>
+
+/**
+ * 已绑定的元素
+ * 用户变化时由一个全局 watcher 统一刷新，而不是每个元素各建一个 effect
+ */
+const bindings = new Map<HTMLElement, PermissionBinding>()
+/** 被隐藏元素的原始 display */
+const hiddenDisplay = new WeakMap<HTMLElement, string>()
+let watching = false
+
+function isAllowed(binding: PermissionBinding): boolean {
+  const { value, modifiers } = binding
+  if (!value || value.length === 0) return true
+
+  const index = useUserStore().permissionIndex
+  if (modifiers.role) {
+    return typeof value === 'string' ? index.hasRole(value) : index.hasAnyRole(value)
+  }
+  return index.hasPermission(value, modifiers.all ? 'every' : 'some')
+}
+
+function apply(el: HTMLElement, binding: PermissionBinding) {
+  const allowed = isAllowed(binding)
+  if (!allowed && !hiddenDisplay.has(el)) {
+    hiddenDisplay.set(el, el.style.display)
+    el.style.display = 'none'
+  } else if (allowed && hiddenDisplay.has(el)) {
+    el.style.display = hiddenDisplay.get(el)!
+    hiddenDisplay.delete(el)
+  }
+}
+
+function ensureWatcher() {
+  if (watching) return
+  watching = true
+  const userStore = useUserStore()
+  watch(
+    () => userStore.permissionIndex,
+    () => bindings.forEach((binding, el) => apply(el, binding))
+  )
+}
+
+/**
+ * 权限指令
+ * @example
+ * <a-button v-permission="'system:user:edit'">编辑</a-button>
+ * <a-button v-permission.all="['system:user:edit', 'system:role:edit']">分配角色</a-button>
+ * <a-button v-permission.role="['admin']">管理</a-button>
+ * @description 无权限时隐藏元素；默认拥有任一权限即可，.all 需全部拥有，.role 按角色判断
+ */
+export const vPermission: Directive<HTMLElement, PermissionValue> = {
+  mounted(el, binding) {
+    ensureWatcher()
+    bindings.set(el, binding)
+    apply(el, binding)
+  },
+  updated(el, binding) {
+    bindings.set(el, binding)
+    apply(el, binding)
+  },
+  unmounted(el) {
+    bindings.delete(el)
+    hiddenDisplay.delete(el)
+  }
+}
+
+declare module 'vue' {
+  interface GlobalDirectives {
+    vPermission: typeof vPermission
+  }
+}
@@ -0,0 +1,123 @@
+/**
+ * 权限索引
+ * 登录后将角色与权限码（如 system:user:edit）一次性编译为 Set 与前缀树，
+ * 之后的每次判断都是哈希查找，判断结果按查询条件缓存。
+ *
+ * 权限码支持通配符：
+ * - 中间段为 * 时匹配任意一段，如 system:*:list
+ * - 末段为 * 时匹配其后的任意段，如 system:* 或 *
+ */
+
+export type PermissionMode = 'some' | 'every'
+
+const SEPARATOR = ':'
+const WILDCARD = '*'
+
+type TrieNode = {
+  children: Map<string, TrieNode>
+  /** 有权限码在此结束 */
+  end: boolean
+  /** 有以 * 结尾的权限码在此展开 */
+  tail: boolean
+}
+
+function createNode(): TrieNode {
+  return { children: new Map(), end: false, tail: false }
+}
+
+export class PermissionIndex {
+  private roles: Set<string>
+  private codes: Set<string>
+  /** 通配符权限码的前缀树（没有通配符时为 null） */
+  private trie: TrieNode | null = null
+  private cache = new Map<string, boolean>()
+
+  constructor(roles: readonly string[] = [], permissions: readonly string[] = []) {
+    this.roles = new Set(roles)
+    this.codes = new Set()
+
+    for (const code of permissions) {
+      if (!code.includes(WILDCARD)) {
+        this.codes.add(code)
+        continue
+      }
+      this.trie ??= createNode()
+      this.insert(code.split(SEPARATOR))
+    }
+  }
+
+  /**
+   * 是否拥有指定角色
+   */
+  hasRole(role: string): boolean {
+    return this.roles.has(role)
+  }
+
+  /**
+   * 是否拥有任一角色（列表为空时视为不限制）
+   */
+  hasAnyRole(roles: readonly string[]): boolean {
+    return roles.length === 0 || roles.some((role) => this.roles.has(role))
+  }
+
+  /**
+   * 是否拥有权限
+   * @param code 权限码或权限码列表（列表为空时视为不限制）
+   * @param mode 列表的判断方式：some 拥有任一即可，every 需全部拥有
+   */
+  hasPermission(code: string | readonly string[], mode: PermissionMode = 'some'): boolean {
+    if (typeof code === 'string') {
+      return this.check(code)
+    }
+    if (code.length === 0) return true
+
+    const key = `${mode}\n${code.join('\n')}`
+    let result = this.cache.get(key)
+    if (result === undefined) {
+      result = mode === 'every' ? code.every((c) => this.check(c)) : code.some((c) => this.check(c))
+      this.cache.set(key, result)
+    }
+    return result
+  }
+
+  private check(code: string): boolean {
+    if (this.codes.has(code)) return true
+    if (!this.trie) return false
+
+    let result = this.cache.get(code)
+    if (result === undefined) {
+      result = this.match(this.trie, code.split(SEPARATOR), 0)
+      this.cache.set(code, result)
+    }
+    return result
+  }
+
+  private insert(segments: string[]) {
+    let node = this.trie!
+    for (let i = 0; i < segments.length; i++) {
+      const segment = segments[i]!
+      if (segment === WILDCARD && i === segments.length - 1) {
+        node.tail = true
+        return
+      }
+      let child = node.children.get(segment)
+      if (!child) {
+        child = createNode()
+        node.children.set(segment, child)
+      }
+      node = child
+    }
+    node.end = true
+  }
+
+  private match(node: TrieNode, segments: string[], i: number): boolean {
+    if (i === segments.length) return node.end
+    if (node.tail) return true
+
+    const child = node.children.get(segments[i]!)
+    if (child && this.match(child, segments, i + 1)) return true
+
+    const any = node.children.get(WILDCARD)
+    return !!any && this.match(any, segments, i + 1)
+  }
+}
@@ -0,0 +1,11 @@
+/**
+ * @fileoverview 权限模块
+ * - PermissionIndex：登录后编译的角色/权限索引
+ * - usePermission：组件中的权限判断
+ * - vPermission：按权限显示元素的指令（main.ts 中注册为 v-permission）
+ */
+export { PermissionIndex } from './engine'
+export type { PermissionMode } from './engine'
+export { usePermission } from './usePermission'
+export { vPermission } from './directive'
+export type { PermissionValue } from './directive'
@@ -0,0 +1,37 @@
+import { computed } from 'vue'
+import { useUserStore } from '@/store/modules/user'
+import type { PermissionMode } from './engine'
+
+/**
+ * 权限判断
+ * @description 判断基于用户 store 中编译好的权限索引，结果在索引内缓存；
+ *              索引只在用户信息变化时重建，在模板中调用时会随之自动更新
+ */
+export function usePermission() {
+  const userStore = useUserStore()
+  const permissionIndex = computed(() => userStore.permissionIndex)
+
+  /**
+   * 是否拥有权限
+   * @param code 权限码或权限码列表
+   * @param mode 列表的判断方式，默认拥有任一即可
+   */
+  function hasPermission(code: string | readonly string[], mode?: PermissionMode): boolean {
+    return permissionIndex.value.hasPermission(code, mode)
+  }
+
+  /**
+   * 是否拥有角色（传入列表时拥有任一即可）
+   */
+  function hasRole(role: string | readonly string[]): boolean {
+    return typeof role === 'string'
+      ? permissionIndex.value.hasRole(role)
+      : permissionIndex.value.hasAnyRole(role)
+  }
+
+  return {
+    permissionIndex,
+    hasPermission,
+    hasRole
+  }
+}
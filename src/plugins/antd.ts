@@ -0,0 +1,34 @@
+/**
+ * @fileoverview Ant Design Vue 按需注册
+ * 登录页不使用 a-* 组件，因此组件注册推迟到首次进入需要登录的页面时进行，
+ * 由路由守卫调用 loadAntdComponents()
+ */
+import type { App } from 'vue'
+
+let app: App | null = null
+let loading: Promise<void> | null = null
+
+/**
+ * 记录应用实例（在 main.ts 中调用）
+ */
+export function setupAntd(instance: App) {
+  app = instance
+}
+
+/**
+ * 加载并注册业务页面使用的组件（只执行一次）
+ */
+export function loadAntdComponents(): Promise<void> {
+  if (!loading) {
+    loading = import('./antdComponents')
+      .then(({ default: components }) => {
+        components.forEach((component) => app?.use(component))
+      })
+      .catch((error) => {
+        // 加载失败时允许下次重试
+        loading = null
+        throw error
+      })
+  }
+  return loading
+}
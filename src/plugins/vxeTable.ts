@@ -0,0 +1,19 @@
+/**
+ * @fileoverview VXE-Table 注册
+ * vxe-table 4.x 的内部子组件与渲染器依赖全局安装的插件，因此通过 app.use 完整安装；
+ * 本模块只被 Crud 组件引用，随业务页面分包加载，登录页不会加载表格代码
+ */
+import type { App } from 'vue'
+import VXETable from 'vxe-table'
+import 'vxe-table/lib/style.css'
+
+const installed = new WeakSet<App>()
+
+/**
+ * 安装 VXE-Table（每个应用只安装一次）
+ */
+export function installVxeTable(app: App) {
+  if (installed.has(app)) return
+  installed.add(app)
+  app.use(VXETable)
+}
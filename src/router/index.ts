@@ -1,105 +1,9 @@
 import { createRouter, createWebHistory } from 'vue-router'
-import type { RouteRecordRaw, NavigationGuardNext } from 'vue-router'
+import type { NavigationGuardNext } from 'vue-router'
 import { useUserStore } from '@/store/modules/user'
 import { usePermissionStore } from '@/store/modules/permission'
-
-// 公开路由（不需要身份验证）
-const publicRoutes: RouteRecordRaw[] = [
-  {
-    path: '/login',
-    name: 'login',
-    component: () => import('@/views/LoginView.vue'),
-    meta: {
-      title: '登录'
-    }
-  }
-]
-
-// 需要动态注册的路由（需要身份验证）
-const asyncRoutes: RouteRecordRaw[] = [
-  {
-    path: '/',
-    name: 'home',
-    component: () => import('@/views/HomeView.vue'),
-    meta: {
-      title: '首页',
-      requiresAuth: true,
-      roles: ['admin', 'user']
-    }
-  },
-  {
-    path: '/dashboard',
-    name: 'dashboard',
-    component: () => import('@/views/DashboardView.vue'),
-    meta: {
-      title: '仪表盘',
-      requiresAuth: true,
-      roles: ['admin']
-    }
-  },
-  {
-    path: '/users',
-    name: 'users',
-    component: () => import('@/views/UsersView/UsersView.vue'),
-    meta: {
-      title: '用户管理',
-      requiresAuth: true,
-      roles: ['admin']
-    }
-  },
-  {
-    path: '/roles',
-    name: 'roles',
-    component: () => import('@/views/RolesView/RolesView.vue'),
-    meta: {
-      title: '角色管理',
-      requiresAuth: true,
-      roles: ['admin']
-    }
-  },
-  {
-    path: '/permissions',
-    name: 'permissions',
-    component: () => import('@/views/PermissionsView/PermissionsView.vue'),
-    meta: {
-      title: '权限管理',
-      requiresAuth: true,
-      roles: ['admin']
-    }
-  },
-  {
-    path: '/settings',
-    name: 'settings',
-    component: () => import('@/views/SettingsView.vue'),
-    meta: {
-      title: '设置',
-      requiresAuth: true,
-      roles: ['admin', 'user']
-    }
-  },
-   {
-    path: '/sys/syslog',
-    name: 'syslog',
-    component: () => import('@/views/SysLogView/SysLogView.vue'),
-    meta: {
-      title: '系统日志',
-      requiresAuth: true,
-      roles: ['admin'],
-      icon: 'setting'
-    }
-  },
-  {
-    path: '/profile',
-    name: 'profile',
-    component: () => import('@/views/ProfileView.vue'),
-    meta: {
-      title: '个人中心',
-      requiresAuth: true,
-      roles: ['admin', 'user']
-    }
-  },
- 
-]
+import { loadAntdComponents } from '@/plugins/antd'
+import { publicRoutes, asyncRoutes } from './routes'
 
 const router = createRouter({
   history: createWebHistory(import.meta.env.BASE_URL),
@@ -176,6 +80,11 @@ router.beforeEach(
                             to.path === '/' || 
                             asyncRoutes.some(route => route.path === to.path)
     
+    // 除登录页外都会渲染主布局，先按需注册 UI 组件（只加载一次）
+    if (hasToken || !isProtectedRoute) {
+      await loadAntdComponents()
+    }
+
     if (isProtectedRoute) {
       if (!hasToken) {
         // 没有 Token，重定向到登录，并保存目标路径
@@ -223,8 +132,7 @@ router.beforeEach(
       // 检查角色权限
       const requiredRoles = to.meta?.roles as string[] | undefined
       if (requiredRoles && requiredRoles.length > 0) {
-        const hasRole = userStore.userRoles.some((role: string) => requiredRoles.includes(role))
-        if (!hasRole) {
+        if (!userStore.permissionIndex.hasAnyRole(requiredRoles)) {
           // 无权访问，重定向到首页
           next({ path: '/' })
           return
@@ -275,12 +183,52 @@ router.isReady().then(() => {
   initializeRoutes()
 })
 
+/**
+ * 预取路由页面代码
+ * @description 在浏览器空闲时加载 meta.prefetch 中列出的下一个可能访问的页面，
+ *              只预取当前用户有权访问的页面；开启省流量模式时不预取
+ * @param names 路由名称
+ * @param withComponents 是否同时预取 UI 组件
+ */
+function prefetchRoutes(names: string[], withComponents: boolean) {
+  if ((navigator as any).connection?.saveData) return
+
+  const run = () => {
+    const userStore = useUserStore()
+    names.forEach((name) => {
+      const route = asyncRoutes.find((r) => r.name === name)
+      if (!route || typeof route.component !== 'function') return
+
+      const roles = route.meta?.roles as string[] | undefined
+      if (roles && userStore.userRoles.length > 0 && !userStore.permissionIndex.hasAnyRole(roles)) {
+        return
+      }
+      ;(route.component as () => Promise<unknown>)().catch(() => {})
+    })
+    // 公开页面（如登录页）空闲时顺便预取业务页面的 UI 组件
+    if (withComponents) {
+      loadAntdComponents().catch(() => {})
+    }
+  }
+
+  if ('requestIdleCallback' in window) {
+    window.requestIdleCallback(run, { timeout: 3000 })
+  } else {
+    setTimeout(run, 1000)
+  }
+}
+
 router.afterEach((to) => {
   import('@/store/modules/tabs').then(({ useTabsStore }) => {
     // 在 Pinia 实例化后才能获取 store
     const tabsStore = useTabsStore()
     tabsStore.addTab(to)
   })
+
+  const prefetch = to.meta?.prefetch as string[] | undefined
+  if (prefetch && prefetch.length > 0) {
+    prefetchRoutes(prefetch, !to.meta?.requiresAuth)
+  }
 })
 
 export default router
@@ -0,0 +1,118 @@
+/**
+ * 路由表
+ * 路由注册、菜单生成与权限判断共用这一份定义
+ * 标签页中的页面默认被缓存（KeepAlive），meta.keepAlive 为 false 时不缓存
+ */
+import type { RouteRecordRaw } from 'vue-router'
+
+// 公开路由（不需要身份验证）
+export const publicRoutes: RouteRecordRaw[] = [
+  {
+    path: '/login',
+    name: 'login',
+    component: () => import('@/views/LoginView.vue'),
+    meta: {
+      title: '登录',
+      prefetch: ['home']
+    }
+  }
+]
+
+// 需要动态注册的路由（需要身份验证）
+export const asyncRoutes: RouteRecordRaw[] = [
+  {
+    path: '/',
+    name: 'home',
+    component: () => import('@/views/HomeView.vue'),
+    meta: {
+      title: '首页',
+      icon: 'home',
+      requiresAuth: true,
+      roles: ['admin', 'user'],
+      prefetch: ['dashboard', 'users']
+    }
+  },
+  {
+    path: '/dashboard',
+    name: 'dashboard',
+    component: () => import('@/views/DashboardView.vue'),
+    meta: {
+      title: '仪表盘',
+      icon: 'dashboard',
+      requiresAuth: true,
+      roles: ['admin'],
+      prefetch: ['users']
+    }
+  },
+  {
+    path: '/users',
+    name: 'users',
+    component: () => import('@/views/UsersView/UsersView.vue'),
+    meta: {
+      title: '用户管理',
+      icon: 'user',
+      requiresAuth: true,
+      roles: ['admin'],
+      prefetch: ['roles']
+    }
+  },
+  {
+    path: '/roles',
+    name: 'roles',
+    component: () => import('@/views/RolesView/RolesView.vue'),
+    meta: {
+      title: '角色管理',
+      icon: 'team',
+      requiresAuth: true,
+      roles: ['admin'],
+      prefetch: ['permissions']
+    }
+  },
+  {
+    path: '/permissions',
+    name: 'permissions',
+    component: () => import('@/views/PermissionsView/PermissionsView.vue'),
+    meta: {
+      title: '权限管理',
+      icon: 'lock',
+      requiresAuth: true,
+      roles: ['admin'],
+      prefetch: ['syslog']
+    }
+  },
+  {
+    path: '/settings',
+    name: 'settings',
+    component: () => import('@/views/SettingsView.vue'),
+    meta: {
+      title: '设置',
+      icon: 'setting',
+      requiresAuth: true,
+      roles: ['admin', 'user'],
+      prefetch: ['profile']
+    }
+  },
+  {
+    path: '/sys/syslog',
+    name: 'syslog',
+    component: () => import('@/views/SysLogView/SysLogView.vue'),
+    meta: {
+      title: '系统日志',
+      requiresAuth: true,
+      roles: ['admin'],
+      icon: 'setting'
+    }
+  },
+  {
+    path: '/profile',
+    name: 'profile',
+    component: () => import('@/views/ProfileView.vue'),
+    meta: {
+      title: '个人中心',
+      hideInMenu: true,
+      keepAlive: false, // 每次进入都重新加载个人信息
+      requiresAuth: true,
+      roles: ['admin', 'user']
+    }
+  }
+]
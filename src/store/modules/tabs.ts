@@ -1,7 +1,7 @@
 // src/store/modules/tabs.ts
 
 import { defineStore } from 'pinia'
-import { ref } from 'vue'
+import { ref, watch, nextTick } from 'vue'
 import { useRouter } from 'vue-router'
 import type { RouteLocationNormalized } from 'vue-router'
 
@@ -14,6 +14,21 @@ export interface TabItem {
   icon?: string
 }
 
+/**
+ * 页面缓存（KeepAlive）配置
+ */
+export interface KeepAliveOptions {
+  /** 最多缓存的页面数 */
+  max: number
+  /** 缓存页面的估算内存上限（字节） */
+  maxMemory: number
+}
+
+const DEFAULT_KEEP_ALIVE_OPTIONS: KeepAliveOptions = {
+  max: 10,
+  maxMemory: 64 * 1024 * 1024
+}
+
 export const useTabsStore = defineStore('tabs', () => {
   const router = useRouter()
 
@@ -21,6 +36,15 @@ export const useTabsStore = defineStore('tabs', () => {
   const tabsList = ref<TabItem[]>([])
   const activeTabPath = ref<string>('')
 
+  // 页面缓存：按最近使用排序（最近使用的在最后），作为 KeepAlive 的 include
+  const cachedViews = ref<string[]>([])
+  // 页面版本号：重新加载时递增，使页面以新的 key 重新创建
+  const viewVersions = ref<Record<string, number>>({})
+  const keepAliveOptions = ref<KeepAliveOptions>({ ...DEFAULT_KEEP_ALIVE_OPTIONS })
+  // 页面估算内存与滚动位置（不需要响应式）
+  const viewSizes = new Map<string, number>()
+  const scrollPositions = new Map<string, number>()
+
   // Actions
   /**
    * 添加一个新标签页
@@ -87,14 +111,138 @@ export const useTabsStore = defineStore('tabs', () => {
   
   // ... 其他关闭方法（如 closeLeft, closeRight）的实现
 
+  /**
+   * 标记页面被访问（加入缓存或移到最近使用）
+   * @param route - 路由信息；meta.keepAlive 为 false 的页面不缓存
+   */
+  function touchView(route: RouteLocationNormalized) {
+    if (route.path === '/login' || route.meta?.hideInTab || route.meta?.keepAlive === false) {
+      return
+    }
+    const index = cachedViews.value.indexOf(route.path)
+    if (index !== -1) {
+      if (index === cachedViews.value.length - 1) return
+      cachedViews.value.splice(index, 1)
+    }
+    cachedViews.value.push(route.path)
+    trimViews(route.path)
+  }
+
+  /**
+   * 移除页面缓存
+   * @param path - 页面路径
+   */
+  function evictView(path: string) {
+    const index = cachedViews.value.indexOf(path)
+    if (index !== -1) cachedViews.value.splice(index, 1)
+    viewSizes.delete(path)
+    scrollPositions.delete(path)
+  }
+
+  /**
+   * 重新加载页面：销毁缓存的实例并重新创建
+   * @param path - 页面路径
+   */
+  async function refreshView(path: string) {
+    const cached = cachedViews.value.includes(path)
+    evictView(path)
+    viewVersions.value[path] = (viewVersions.value[path] || 0) + 1
+    // 等 KeepAlive 卸载旧实例后再恢复缓存
+    await nextTick()
+    if (cached && !cachedViews.value.includes(path)) {
+      cachedViews.value.push(path)
+    }
+  }
+
+  /**
+   * 记录页面的估算内存
+   * @param path - 页面路径
+   * @param bytes - 估算字节数
+   * @param keepPath - 不淘汰的页面，导航过程中应传入目标页面（此时 activeTabPath 仍是离开的页面）
+   */
+  function setViewSize(path: string, bytes: number, keepPath?: string) {
+    if (!cachedViews.value.includes(path)) return
+    viewSizes.set(path, bytes)
+    trimViews(keepPath)
+  }
+
+  /**
+   * 超出数量或内存上限时，淘汰最久未使用的页面
+   * @param keepPath - 不淘汰的页面，默认为当前标签页
+   */
+  function trimViews(keepPath: string = activeTabPath.value) {
+    const { max, maxMemory } = keepAliveOptions.value
+    let total = 0
+    viewSizes.forEach((size) => (total += size))
+
+    let i = 0
+    while (
+      i < cachedViews.value.length &&
+      (cachedViews.value.length > max || total > maxMemory)
+    ) {
+      const path = cachedViews.value[i]!
+      if (path === keepPath) {
+        i++
+        continue
+      }
+      total -= viewSizes.get(path) || 0
+      evictView(path)
+    }
+  }
+
+  /**
+   * 修改页面缓存配置
+   */
+  function setKeepAliveOptions(options: Partial<KeepAliveOptions>) {
+    keepAliveOptions.value = { ...keepAliveOptions.value, ...options }
+    trimViews()
+  }
+
+  /**
+   * 保存页面滚动位置
+   */
+  function saveScrollTop(path: string, top: number) {
+    if (cachedViews.value.includes(path)) {
+      scrollPositions.set(path, top)
+    }
+  }
+
+  /**
+   * 获取页面滚动位置（未缓存的页面会重新创建，从顶部开始）
+   */
+  function getScrollTop(path: string): number {
+    return cachedViews.value.includes(path) ? scrollPositions.get(path) || 0 : 0
+  }
+
+  // 标签页关闭时释放对应的页面缓存
+  watch(
+    () => tabsList.value.map((tab) => tab.path),
+    (paths, oldPaths) => {
+      oldPaths.filter((path) => !paths.includes(path)).forEach(evictView)
+    }
+  )
+
   return {
     tabsList,
     activeTabPath,
+    cachedViews,
+    viewVersions,
+    keepAliveOptions,
     addTab,
     removeTab,
     closeOtherTabs,
     closeAllTabs,
+    touchView,
+    evictView,
+    refreshView,
+    setViewSize,
+    setKeepAliveOptions,
+    saveScrollTop,
+    getScrollTop,
   }
 }, {
-  persist: true // 启用持久化
+  // 只持久化标签页，页面缓存是运行时状态
+  persist: {
+    pick: ['tabsList', 'activeTabPath']
+  }
 })
@@ -1,7 +1,8 @@
 import { defineStore } from 'pinia'
-import { ref, computed } from 'vue'
+import { ref, computed, markRaw } from 'vue'
 import { userApi } from '@/api/user'
 import type { UserInfo, LoginRequest } from '@/api/types'
+import { PermissionIndex } from '@/permission/engine'
 
 export const useUserStore = defineStore(
   'user',
@@ -16,6 +17,10 @@ export const useUserStore = defineStore(
     const userName = computed(() => userInfo.value?.realName || userInfo.value?.username || '')
     const userRoles = computed(() => userInfo.value?.roles || [])
     const userPermissions = computed(() => userInfo.value?.permissions || [])
+    // 权限索引：用户信息变化时重新编译，其余时间所有权限判断共用
+    const permissionIndex = computed(() =>
+      markRaw(new PermissionIndex(userRoles.value, userPermissions.value))
+    )
 
     /**
      * 登录
@@ -64,14 +69,14 @@ export const useUserStore = defineStore(
      * 检查用户是否有指定角色
      */
     function hasRole(role: string): boolean {
-      return userRoles.value.includes(role)
+      return permissionIndex.value.hasRole(role)
     }
 
     /**
      * 检查用户是否有指定权限
      */
     function hasPermission(permission: string): boolean {
-      return userPermissions.value.includes(permission)
+      return permissionIndex.value.hasPermission(permission)
     }
 
     /**
@@ -111,6 +116,7 @@ export const useUserStore = defineStore(
       userName,
       userRoles,
       userPermissions,
+      permissionIndex,
       // 方法
       login,
       getCurrentUser,